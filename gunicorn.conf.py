@@ -0,0 +1,2 @@
+# Picked up automatically by `gunicorn main:app`
+preload_app = True  # import main (templates, DB warmup) once in the master; workers reconnect after fork
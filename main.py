@@ -1,15 +1,38 @@
 # main.py
-from flask import Flask, render_template_string, request, jsonify, session, redirect, url_for
-import json, os, hashlib
+from flask import Flask, Response, request, jsonify, session, redirect, url_for
+import json, os, re, random, gzip, hashlib, hmac, sqlite3, threading
 from functools import wraps
+from dataclasses import dataclass
+from types import MappingProxyType
+try:
+    import orjson
+    # decoded to str so rows are stored as TEXT (the column type) under both backends
+    json_dumps, json_loads = lambda o: orjson.dumps(o).decode(), orjson.loads
+except ImportError:  # stdlib fallback so the app still runs without the wheel
+    json_dumps, json_loads = json.dumps, json.loads
 
 app = Flask(__name__)
 app.secret_key = 'ruhi_qnr_ultra_girly_secret_2024'
-
-DB_FILE = 'database.json'
-
-DEFAULT_DB = {
-    "password": hashlib.sha256("admin123".encode()).hexdigest(),
+app.config['MAX_CONTENT_LENGTH'] = 256 * 1024  # admin forms are a few KB; 413 anything bigger before parsing
+
+DB_FILE = 'database.db'
+LEGACY_DB_FILE = 'database.json'  # old flat-file store, imported on first boot
+
+# The cached DB is shared by every request thread, so hand it out read-only
+def freeze(o):
+    if isinstance(o, dict): return MappingProxyType({k: freeze(v) for k, v in o.items()})
+    if isinstance(o, list): return tuple(freeze(v) for v in o)
+    return o
+
+def thaw(o):
+    # back to plain dicts/lists — for editing, and for tojson/orjson which reject mappingproxy
+    if isinstance(o, MappingProxyType): return {k: thaw(v) for k, v in o.items()}
+    if isinstance(o, tuple): return [thaw(v) for v in o]
+    return o
+
+# Read-only template (frozen all the way down) — hand out default_db() copies, never this object
+DEFAULT_DB = freeze({
+    "password": "240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9",  # sha256("admin123")
     "profile": {
         "name": "RUHI",
         "subtitle": "& QNR",
@@ -49,31 +72,117 @@ DEFAULT_DB = {
         "She's almost ready... 💗",
         "Welcome to her world. 🌙"
     ]
-}
-
-def load_db():
-    if not os.path.exists(DB_FILE):
-        save_db(DEFAULT_DB); return DEFAULT_DB
-    try:
-        with open(DB_FILE, 'r') as f:
-            data = json.load(f)
-        for k in DEFAULT_DB:
-            if k not in data: data[k] = DEFAULT_DB[k]
-        if 'media_map' not in data: data['media_map'] = DEFAULT_DB['media_map']
-        if 'bestie' not in data.get('media_map', {}): data['media_map']['bestie'] = ''
-        if 'bestie' not in data.get('profile', {}): data['profile']['bestie'] = DEFAULT_DB['profile']['bestie']
-        if 'subtitle' not in data.get('profile', {}): data['profile']['subtitle'] = DEFAULT_DB['profile']['subtitle']
-        if 'avatar2' not in data.get('profile', {}): data['profile']['avatar2'] = ''
-        if 'background_video' not in data: data['background_video'] = ''
-        return data
-    except: return DEFAULT_DB
+})
+
+def default_db():
+    return thaw(DEFAULT_DB)
+
+# One connection per process; each top-level DB key is a row in `kv`
+def connect():
+    global conn, conn_lock
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("CREATE TABLE IF NOT EXISTS kv (section TEXT PRIMARY KEY, data TEXT NOT NULL)")
+    conn_lock = threading.Lock()
+
+connect()
+
+# Parsed DB, valid while SQLite's data_version is unchanged (it only moves when
+# another connection/worker commits; our own writes refresh the cache directly).
+# load_db() hands out the shared frozen copy — routes that edit use load_db_mutable().
+db_cache = {'version': None, 'data': None}
+
+def with_defaults(section, value):
+    # one-level merge so keys added to DEFAULT_DB later show up in older stores
+    default = DEFAULT_DB.get(section)
+    return {**default, **value} if isinstance(default, MappingProxyType) else value
+
+def load_db(section=None):
+    # section='password' etc. reads just that row on a cache miss
+    with conn_lock:
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        if version == db_cache['version']:
+            return db_cache['data'] if section is None else db_cache['data'][section]
+        if section is not None:
+            row = conn.execute("SELECT data FROM kv WHERE section = ?", (section,)).fetchone()
+            return freeze(with_defaults(section, json_loads(row[0])) if row else DEFAULT_DB[section])
+        rows = conn.execute("SELECT section, data FROM kv").fetchall()
+        if rows:
+            # parse and install under the lock, so a save_db on another thread can't
+            # commit in between and then be overwritten by these older rows
+            data = freeze({**DEFAULT_DB, **{k: with_defaults(k, json_loads(v)) for k, v in rows}})
+            db_cache.update(version=version, data=data)
+            return data
+    save_db(default_db())  # empty store: write the defaults, which also caches them
+    return db_cache['data']
+
+def load_db_mutable():
+    return thaw(load_db())
 
 def save_db(data):
-    with open(DB_FILE, 'w') as f: json.dump(data, f, indent=2)
+    # written before the caller answers, and cached only once COMMIT succeeds, so an
+    # error (e.g. "database is locked") reaches the caller and nothing unsaved is served
+    rows = [(k, json_dumps(v)) for k, v in data.items()]
+    with conn_lock:
+        # one transaction, so a crash can never leave half the sections written
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # only rewrite sections whose bytes changed; an unchanged form submit writes nothing
+            stored = dict(conn.execute("SELECT section, data FROM kv"))
+            rows = [r for r in rows if stored.get(r[0]) != r[1]]
+            if rows: conn.executemany("INSERT OR REPLACE INTO kv VALUES (?, ?)", rows)
+        except BaseException:
+            conn.execute("ROLLBACK"); raise
+        conn.execute("COMMIT")
+        db_cache['data'] = freeze(data)
+
+def migrate_legacy_db():
+    if not os.path.exists(LEGACY_DB_FILE): return
+    with conn_lock:
+        if conn.execute("SELECT 1 FROM kv LIMIT 1").fetchone(): return
+    try:
+        with open(LEGACY_DB_FILE, 'rb') as f:
+            data = json_loads(f.read())
+        if not isinstance(data, dict): raise ValueError('top level is not an object')
+    except (OSError, ValueError) as e:
+        # a bad legacy file must not stop startup; fall back to the defaults like before
+        app.logger.warning('Skipping %s import: %s', LEGACY_DB_FILE, e)
+        return
+    save_db(data)
+
+migrate_legacy_db()
+
+# gunicorn preload_app imports us once in the master and forks workers after that.
+# A SQLite handle must not be used across fork, so each child opens its own.
+def reinit_after_fork():
+    global parent_conn
+    parent_conn = conn  # keep the parent's handle referenced so the child never closes it
+    connect()
+    db_cache['version'] = None  # data_version is per connection; recheck once, pages are already warm
+
+if hasattr(os, 'register_at_fork'): os.register_at_fork(after_in_child=reinit_after_fork)
+
+load_db()  # parse + warm the OS page cache before serving (or forking)
+
+pw_digest = (None, None)  # (stored hex, decoded bytes); decode once per password change
+
+def verify_password(pw, stored_hex):
+    # compare raw digests in constant time instead of hex strings with ==
+    global pw_digest
+    cached_hex, stored = pw_digest
+    if cached_hex != stored_hex:
+        try: stored = bytes.fromhex(stored_hex)
+        except ValueError: stored = None
+        pw_digest = (stored_hex, stored)
+    if stored is None: return False
+    return hmac.compare_digest(hashlib.sha256(pw.encode()).digest(), stored)
 
 def login_required(f):
     @wraps(f)
     def dec(*a, **k):
+        # only admin routes touch the session, so public responses don't get Vary: Cookie
         if not session.get('admin'): return redirect('/admin/login')
         return f(*a, **k)
     return dec
@@ -81,14 +190,61 @@ def login_required(f):
 # ══════════════════════════════════════════════
 #  MAIN TEMPLATE — GOD LEVEL
 # ══════════════════════════════════════════════
+# Inline SVG sprite for the few icons the pages use, instead of the whole Font Awesome
+# stylesheet + webfont. Glyphs from Font Awesome 4.7 (SIL OFL 1.1), tiktok from
+# Font Awesome 6 Free (CC BY 4.0); the disc is drawn here.
+ICON_SPRITE = ('<svg xmlns="http://www.w3.org/2000/svg" style="display:none">'
+    '<symbol id="i-instagram" viewBox="0 -1536 1536 1792"><path transform="scale(1 -1)" d="M1024 640q0 106 -75 181t-181 75t-181 -75t-75 -181t75 -181t181 -75t181 75t75 181zM1162 640q0 -164 -115 -279t-279 -115t-279 115t-115 279t115 279t279 115t279 -115t115 -279zM1270 1050q0 -38 -27 -65t-65 -27t-65 27t-27 65t27 65t65 27t65 -27t27 -65zM768 1270 q-7 0 -76.5 0.5t-105.5 0t-96.5 -3t-103 -10t-71.5 -18.5q-50 -20 -88 -58t-58 -88q-11 -29 -18.5 -71.5t-10 -103t-3 -96.5t0 -105.5t0.5 -76.5t-0.5 -76.5t0 -105.5t3 -96.5t10 -103t18.5 -71.5q20 -50 58 -88t88 -58q29 -11 71.5 -18.5t103 -10t96.5 -3t105.5 0t76.5 0.5 t76.5 -0.5t105.5 0t96.5 3t103 10t71.5 18.5q50 20 88 58t58 88q11 29 18.5 71.5t10 103t3 96.5t0 105.5t-0.5 76.5t0.5 76.5t0 105.5t-3 96.5t-10 103t-18.5 71.5q-20 50 -58 88t-88 58q-29 11 -71.5 18.5t-103 10t-96.5 3t-105.5 0t-76.5 -0.5zM1536 640q0 -229 -5 -317 q-10 -208 -124 -322t-322 -124q-88 -5 -317 -5t-317 5q-208 10 -322 124t-124 322q-5 88 -5 317t5 317q10 208 124 322t322 124q88 5 317 5t317 -5q208 -10 322 -124t124 -322q5 -88 5 -317z"/></symbol>'
+    '<symbol id="i-twitter" viewBox="0 -1536 1664 1792"><path transform="scale(1 -1)" d="M1620 1128q-67 -98 -162 -167q1 -14 1 -42q0 -130 -38 -259.5t-115.5 -248.5t-184.5 -210.5t-258 -146t-323 -54.5q-271 0 -496 145q35 -4 78 -4q225 0 401 138q-105 2 -188 64.5t-114 159.5q33 -5 61 -5q43 0 85 11q-112 23 -185.5 111.5t-73.5 205.5v4q68 -38 146 -41 q-66 44 -105 115t-39 154q0 88 44 163q121 -149 294.5 -238.5t371.5 -99.5q-8 38 -8 74q0 134 94.5 228.5t228.5 94.5q140 0 236 -102q109 21 205 78q-37 -115 -142 -178q93 10 186 50z"/></symbol>'
+    '<symbol id="i-youtube" viewBox="0 -1536 1792 1792"><path transform="scale(1 -1)" d="M711 408l484 250l-484 253v-503zM896 1270q168 0 324.5 -4.5t229.5 -9.5l73 -4q1 0 17 -1.5t23 -3t23.5 -4.5t28.5 -8t28 -13t31 -19.5t29 -26.5q6 -6 15.5 -18.5t29 -58.5t26.5 -101q8 -64 12.5 -136.5t5.5 -113.5v-40v-136q1 -145 -18 -290q-7 -55 -25 -99.5t-32 -61.5 l-14 -17q-14 -15 -29 -26.5t-31 -19t-28 -12.5t-28.5 -8t-24 -4.5t-23 -3t-16.5 -1.5q-251 -19 -627 -19q-207 2 -359.5 6.5t-200.5 7.5l-49 4l-36 4q-36 5 -54.5 10t-51 21t-56.5 41q-6 6 -15.5 18.5t-29 58.5t-26.5 101q-8 64 -12.5 136.5t-5.5 113.5v40v136 q-1 145 18 290q7 55 25 99.5t32 61.5l14 17q14 15 29 26.5t31 19.5t28 13t28.5 8t23.5 4.5t23 3t17 1.5q251 18 627 18z"/></symbol>'
+    '<symbol id="i-snapchat" viewBox="0 -1536 1664 1792"><path transform="scale(1 -1)" d="M848 1408q134 1 240.5 -68.5t163.5 -192.5q27 -58 27 -179q0 -47 -9 -191q14 -7 28 -7q18 0 51 13.5t51 13.5q29 0 56 -18t27 -46q0 -32 -31.5 -54t-69 -31.5t-69 -29t-31.5 -47.5q0 -15 12 -43q37 -82 102.5 -150t144.5 -101q28 -12 80 -23q28 -6 28 -35 q0 -70 -219 -103q-7 -11 -11 -39t-14 -46.5t-33 -18.5q-20 0 -62 6.5t-64 6.5q-37 0 -62 -5q-32 -5 -63 -22.5t-58 -38t-58 -40.5t-76 -33.5t-99 -13.5q-52 0 -96.5 13.5t-75 33.5t-57.5 40.5t-58 38t-62 22.5q-26 5 -63 5q-24 0 -65.5 -7.5t-58.5 -7.5q-25 0 -35 18.5 t-14 47.5t-11 40q-219 33 -219 103q0 29 28 35q52 11 80 23q78 32 144.5 101t102.5 150q12 28 12 43q0 28 -31.5 47.5t-69.5 29.5t-69.5 31.5t-31.5 52.5q0 27 26 45.5t55 18.5q15 0 48 -13t53 -13q18 0 32 7q-9 142 -9 190q0 122 27 180q64 137 172 198t264 63z"/></symbol>'
+    '<symbol id="i-play" viewBox="0 -1536 1408 1792"><path transform="scale(1 -1)" d="M1384 609l-1328 -738q-23 -13 -39.5 -3t-16.5 36v1472q0 26 16.5 36t39.5 -3l1328 -738q23 -13 23 -31t-23 -31z"/></symbol>'
+    '<symbol id="i-tiktok" viewBox="0 0 448 512"><path d="M448 209.9a210.1 210.1 0 0 1 -122.8-39.3V349.4A162.6 162.6 0 1 1 185 188.3V278.2a74.6 74.6 0 1 0 52.2 71.2V0l88 0a121.2 121.2 0 0 0 1.9 22.2h0A122.2 122.2 0 0 0 381 102.4a121.4 121.4 0 0 0 67 20.1z"/></symbol>'
+    '<symbol id="i-disc" viewBox="0 0 512 512"><path fill-rule="evenodd" d="M256 0a256 256 0 1 0 0 512a256 256 0 1 0 0-512zm0 176a80 80 0 1 0 0 160a80 80 0 1 0 0-160zm0 56a24 24 0 1 1 0 48a24 24 0 1 1 0-48zM256 64a192 192 0 0 0-192 192h40a152 152 0 0 1 152-152z"/></symbol>'
+    '</svg>')
+
+# Admin-only glyphs (Font Awesome 4.7 outlines, same form as ICON_SPRITE); each admin page
+# inlines just the symbols it references, so neither page needs the icon font CDN
+ADMIN_ICONS = (
+    '<symbol id="i-eye" viewBox="0 -1536 1792 1792"><path transform="scale(1 -1)" d="M1664 576q-152 236 -381 353q61 -104 61 -225q0 -185 -131.5 -316.5t-316.5 -131.5t-316.5 131.5t-131.5 316.5q0 121 61 225q-229 -117 -381 -353q133 -205 333.5 -326.5t434.5 -121.5t434.5 121.5t333.5 326.5zM944 960q0 20 -14 34t-34 14q-125 0 -214.5 -89.5 t-89.5 -214.5q0 -20 14 -34t34 -14t34 14t14 34q0 86 61 147t147 61q20 0 34 14t14 34zM1792 576q0 -34 -20 -69q-140 -230 -376.5 -368.5t-499.5 -138.5t-499.5 139t-376.5 368q-20 35 -20 69t20 69q140 229 376.5 368t499.5 139t499.5 -139t376.5 -368q20 -35 20 -69z"/></symbol>'
+    '<symbol id="i-sign-out" viewBox="0 -1536 1664 1792"><path transform="scale(1 -1)" d="M640 96q0 -4 1 -20t0.5 -26.5t-3 -23.5t-10 -19.5t-20.5 -6.5h-320q-119 0 -203.5 84.5t-84.5 203.5v704q0 119 84.5 203.5t203.5 84.5h320q13 0 22.5 -9.5t9.5 -22.5q0 -4 1 -20t0.5 -26.5t-3 -23.5t-10 -19.5t-20.5 -6.5h-320q-66 0 -113 -47t-47 -113v-704 q0 -66 47 -113t113 -47h288h11h13t11.5 -1t11.5 -3t8 -5.5t7 -9t2 -13.5zM1568 640q0 -26 -19 -45l-544 -544q-19 -19 -45 -19t-45 19t-19 45v288h-448q-26 0 -45 19t-19 45v384q0 26 19 45t45 19h448v288q0 26 19 45t45 19t45 -19l544 -544q19 -19 19 -45z"/></symbol>'
+    '<symbol id="i-check-circle" viewBox="0 -1536 1536 1792"><path transform="scale(1 -1)" d="M1284 802q0 28 -18 46l-91 90q-19 19 -45 19t-45 -19l-408 -407l-226 226q-19 19 -45 19t-45 -19l-91 -90q-18 -18 -18 -46q0 -27 18 -45l362 -362q19 -19 45 -19q27 0 46 19l543 543q18 18 18 45zM1536 640q0 -209 -103 -385.5t-279.5 -279.5t-385.5 -103t-385.5 103 t-279.5 279.5t-103 385.5t103 385.5t279.5 279.5t385.5 103t385.5 -103t279.5 -279.5t103 -385.5z"/></symbol>'
+    '<symbol id="i-exclamation-circle" viewBox="0 -1536 1536 1792"><path transform="scale(1 -1)" d="M768 1408q209 0 385.5 -103t279.5 -279.5t103 -385.5t-103 -385.5t-279.5 -279.5t-385.5 -103t-385.5 103t-279.5 279.5t-103 385.5t103 385.5t279.5 279.5t385.5 103zM896 161v190q0 14 -9 23.5t-22 9.5h-192q-13 0 -23 -10t-10 -23v-190q0 -13 10 -23t23 -10h192 q13 0 22 9.5t9 23.5zM894 505l18 621q0 12 -10 18q-10 8 -24 8h-220q-14 0 -24 -8q-10 -6 -10 -18l17 -621q0 -10 10 -17.5t24 -7.5h185q14 0 23.5 7.5t10.5 17.5z"/></symbol>'
+    '<symbol id="i-times-circle" viewBox="0 -1536 1536 1792"><path transform="scale(1 -1)" d="M1149 414q0 26 -19 45l-181 181l181 181q19 19 19 45q0 27 -19 46l-90 90q-19 19 -46 19q-26 0 -45 -19l-181 -181l-181 181q-19 19 -45 19q-27 0 -46 -19l-90 -90q-19 -19 -19 -46q0 -26 19 -45l181 -181l-181 -181q-19 -19 -19 -45q0 -27 19 -46l90 -90q19 -19 46 -19 q26 0 45 19l181 181l181 -181q19 -19 45 -19q27 0 46 19l90 90q19 19 19 46zM1536 640q0 -209 -103 -385.5t-279.5 -279.5t-385.5 -103t-385.5 103t-279.5 279.5t-103 385.5t103 385.5t279.5 279.5t385.5 103t385.5 -103t279.5 -279.5t103 -385.5z"/></symbol>'
+    '<symbol id="i-lock" viewBox="0 -1536 1152 1792"><path transform="scale(1 -1)" d="M320 768h512v192q0 106 -75 181t-181 75t-181 -75t-75 -181v-192zM1152 672v-576q0 -40 -28 -68t-68 -28h-960q-40 0 -68 28t-28 68v576q0 40 28 68t68 28h32v192q0 184 132 316t316 132t316 -132t132 -316v-192h32q40 0 68 -28t28 -68z"/></symbol>'
+    '<symbol id="i-user" viewBox="0 -1536 1280 1792"><path transform="scale(1 -1)" d="M1280 137q0 -109 -62.5 -187t-150.5 -78h-854q-88 0 -150.5 78t-62.5 187q0 85 8.5 160.5t31.5 152t58.5 131t94 89t134.5 34.5q131 -128 313 -128t313 128q76 0 134.5 -34.5t94 -89t58.5 -131t31.5 -152t8.5 -160.5zM1024 1024q0 -159 -112.5 -271.5t-271.5 -112.5 t-271.5 112.5t-112.5 271.5t112.5 271.5t271.5 112.5t271.5 -112.5t112.5 -271.5z"/></symbol>'
+    '<symbol id="i-id-card" viewBox="0 -1536 2048 1792"><path transform="scale(1 -1)" d="M896 324q0 54 -7.5 100.5t-24.5 90t-51 68.5t-81 25q-64 -64 -156 -64t-156 64q-47 0 -81 -25t-51 -68.5t-24.5 -90t-7.5 -100.5q0 -55 31.5 -93.5t75.5 -38.5h426q44 0 75.5 38.5t31.5 93.5zM768 768q0 80 -56 136t-136 56t-136 -56t-56 -136t56 -136t136 -56t136 56 t56 136zM1792 288v64q0 14 -9 23t-23 9h-704q-14 0 -23 -9t-9 -23v-64q0 -14 9 -23t23 -9h704q14 0 23 9t9 23zM1408 544v64q0 14 -9 23t-23 9h-320q-14 0 -23 -9t-9 -23v-64q0 -14 9 -23t23 -9h320q14 0 23 9t9 23zM1792 544v64q0 14 -9 23t-23 9h-192q-14 0 -23 -9t-9 -23 v-64q0 -14 9 -23t23 -9h192q14 0 23 9t9 23zM1792 800v64q0 14 -9 23t-23 9h-704q-14 0 -23 -9t-9 -23v-64q0 -14 9 -23t23 -9h704q14 0 23 9t9 23zM128 1152h1792v96q0 14 -9 23t-23 9h-1728q-14 0 -23 -9t-9 -23v-96zM2048 1248v-1216q0 -66 -47 -113t-113 -47h-1728 q-66 0 -113 47t-47 113v1216q0 66 47 113t113 47h1728q66 0 113 -47t47 -113z"/></symbol>'
+    '<symbol id="i-share-alt" viewBox="0 -1536 1536 1792"><path transform="scale(1 -1)" d="M1216 512q133 0 226.5 -93.5t93.5 -226.5t-93.5 -226.5t-226.5 -93.5t-226.5 93.5t-93.5 226.5q0 12 2 34l-360 180q-92 -86 -218 -86q-133 0 -226.5 93.5t-93.5 226.5t93.5 226.5t226.5 93.5q126 0 218 -86l360 180q-2 22 -2 34q0 133 93.5 226.5t226.5 93.5 t226.5 -93.5t93.5 -226.5t-93.5 -226.5t-226.5 -93.5q-126 0 -218 86l-360 -180q2 -22 2 -34t-2 -34l360 -180q92 86 218 86z"/></symbol>'
+    '<symbol id="i-film" viewBox="0 -1536 1920 1792"><path transform="scale(1 -1)" d="M384 -64v128q0 26 -19 45t-45 19h-128q-26 0 -45 -19t-19 -45v-128q0 -26 19 -45t45 -19h128q26 0 45 19t19 45zM384 320v128q0 26 -19 45t-45 19h-128q-26 0 -45 -19t-19 -45v-128q0 -26 19 -45t45 -19h128q26 0 45 19t19 45zM384 704v128q0 26 -19 45t-45 19h-128 q-26 0 -45 -19t-19 -45v-128q0 -26 19 -45t45 -19h128q26 0 45 19t19 45zM1408 -64v512q0 26 -19 45t-45 19h-768q-26 0 -45 -19t-19 -45v-512q0 -26 19 -45t45 -19h768q26 0 45 19t19 45zM384 1088v128q0 26 -19 45t-45 19h-128q-26 0 -45 -19t-19 -45v-128q0 -26 19 -45 t45 -19h128q26 0 45 19t19 45zM1792 -64v128q0 26 -19 45t-45 19h-128q-26 0 -45 -19t-19 -45v-128q0 -26 19 -45t45 -19h128q26 0 45 19t19 45zM1408 704v512q0 26 -19 45t-45 19h-768q-26 0 -45 -19t-19 -45v-512q0 -26 19 -45t45 -19h768q26 0 45 19t19 45zM1792 320v128 q0 26 -19 45t-45 19h-128q-26 0 -45 -19t-19 -45v-128q0 -26 19 -45t45 -19h128q26 0 45 19t19 45zM1792 704v128q0 26 -19 45t-45 19h-128q-26 0 -45 -19t-19 -45v-128q0 -26 19 -45t45 -19h128q26 0 45 19t19 45zM1792 1088v128q0 26 -19 45t-45 19h-128q-26 0 -45 -19 t-19 -45v-128q0 -26 19 -45t45 -19h128q26 0 45 19t19 45zM1920 1248v-1344q0 -66 -47 -113t-113 -47h-1600q-66 0 -113 47t-47 113v1344q0 66 47 113t113 47h1600q66 0 113 -47t47 -113z"/></symbol>'
+    '<symbol id="i-pencil" viewBox="0 -1536 1536 1792"><path transform="scale(1 -1)" d="M363 0l91 91l-235 235l-91 -91v-107h128v-128h107zM886 928q0 22 -22 22q-10 0 -17 -7l-542 -542q-7 -7 -7 -17q0 -22 22 -22q10 0 17 7l542 542q7 7 7 17zM832 1120l416 -416l-832 -832h-416v416zM1515 1024q0 -53 -37 -90l-166 -166l-416 416l166 165q36 38 90 38 q53 0 91 -38l235 -234q37 -39 37 -91z"/></symbol>'
+    '<symbol id="i-play-circle" viewBox="0 -1536 1536 1792"><path transform="scale(1 -1)" d="M768 1408q209 0 385.5 -103t279.5 -279.5t103 -385.5t-103 -385.5t-279.5 -279.5t-385.5 -103t-385.5 103t-279.5 279.5t-103 385.5t103 385.5t279.5 279.5t385.5 103zM1152 585q32 18 32 55t-32 55l-544 320q-31 19 -64 1q-32 -19 -32 -56v-640q0 -37 32 -56 q16 -8 32 -8q17 0 32 9z"/></symbol>'
+    '<symbol id="i-save" viewBox="0 -1536 1536 1792"><path transform="scale(1 -1)" d="M384 0h768v384h-768v-384zM1280 0h128v896q0 14 -10 38.5t-20 34.5l-281 281q-10 10 -34 20t-39 10v-416q0 -40 -28 -68t-68 -28h-576q-40 0 -68 28t-28 68v416h-128v-1280h128v416q0 40 28 68t68 28h832q40 0 68 -28t28 -68v-416zM896 928v320q0 13 -9.5 22.5t-22.5 9.5 h-192q-13 0 -22.5 -9.5t-9.5 -22.5v-320q0 -13 9.5 -22.5t22.5 -9.5h192q13 0 22.5 9.5t9.5 22.5zM1536 896v-928q0 -40 -28 -68t-68 -28h-1344q-40 0 -68 28t-28 68v1344q0 40 28 68t68 28h928q40 0 88 -20t76 -48l280 -280q28 -28 48 -76t20 -88z"/></symbol>'
+    '<symbol id="i-key" viewBox="0 -1536 1792 1792"><path transform="scale(1 -1)" d="M832 1024q0 80 -56 136t-136 56t-136 -56t-56 -136q0 -42 19 -83q-41 19 -83 19q-80 0 -136 -56t-56 -136t56 -136t136 -56t136 56t56 136q0 42 -19 83q41 -19 83 -19q80 0 136 56t56 136zM1683 320q0 -17 -49 -66t-66 -49q-9 0 -28.5 16t-36.5 33t-38.5 40t-24.5 26 l-96 -96l220 -220q28 -28 28 -68q0 -42 -39 -81t-81 -39q-40 0 -68 28l-671 671q-176 -131 -365 -131q-163 0 -265.5 102.5t-102.5 265.5q0 160 95 313t248 248t313 95q163 0 265.5 -102.5t102.5 -265.5q0 -189 -131 -365l355 -355l96 96q-3 3 -26 24.5t-40 38.5t-33 36.5 t-16 28.5q0 17 49 66t66 49q13 0 23 -10q6 -6 46 -44.5t82 -79.5t86.5 -86t73 -78t28.5 -41z"/></symbol>'
+)
+
+SYMBOL_RE = re.compile(r'<symbol id="i-([\w-]+)".*?</symbol>')
+
+def with_icons(html, extra=()):
+    symbols = {m.group(1): m.group(0) for m in SYMBOL_RE.finditer(ICON_SPRITE + ADMIN_ICONS)}
+    used = dict.fromkeys([*re.findall(r'href="#i-([\w-]+)"', html), *extra])
+    sprite = '<svg xmlns="http://www.w3.org/2000/svg" style="display:none">' + ''.join(symbols[n] for n in used) + '</svg>'
+    return html.replace('<body>', '<body>\n' + sprite, 1)
+
+MAIN_FONTS_CSS = 'https://fonts.googleapis.com/css2?family=Playfair+Display:ital,wght@1,700;1,900&family=Cormorant+Garamond:ital,wght@1,300;1,400&family=Dancing+Script:wght@400;600&family=Poppins:wght@400;500&family=Montserrat:wght@700&display=swap'
+# Sent with the home page so the browser starts on fonts before it parses <head>
+MAIN_LINK_HEADER = f'<{MAIN_FONTS_CSS}>; rel=preload; as=style, <https://fonts.gstatic.com>; rel=preconnect; crossorigin'
+
 MAIN = r"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width,initial-scale=1.0">
 <title>{{ p.name }} {{ p.subtitle }} 🌸</title>
-<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:ital,wght@0,400;0,700;0,900;1,400;1,700&family=Cormorant+Garamond:ital,wght@0,300;0,400;0,600;1,300;1,600&family=Dancing+Script:wght@400;600;700&family=Poppins:wght@200;300;400;500;600;700&family=Montserrat:wght@100;200;300;400;700;900&display=swap" rel="stylesheet">
-<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.0/css/all.min.css">
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+{% if has_youtube %}<link rel="preconnect" href="https://www.youtube.com">
+<link rel="dns-prefetch" href="https://i.ytimg.com">{% endif %}
+<link href="{{ fonts_css }}" rel="stylesheet">
 <style>
 :root{
   --pk:#ff4d8d;--pk2:#ff85b3;--pk3:#ffc2d9;--pk4:#fff0f5;
@@ -98,11 +254,14 @@ MAIN = r"""<!DOCTYPE html>
   --dark:#1a0020;--dark2:#2d0035;--dark3:#0d0015;
   --glass:rgba(255,255,255,0.07);
   --glass2:rgba(255,255,255,0.12);
+  --glass-solid:rgba(40,0,50,.6);
   --border:rgba(255,130,180,0.25);
   --shadow:rgba(255,77,141,0.4);
 }
 *,*::before,*::after{margin:0;padding:0;box-sizing:border-box;}
 html{scroll-behavior:smooth;}
+.ic{width:1em;height:1em;fill:currentColor;vertical-align:-.125em;}
+@keyframes spin{from{transform:rotate(0deg);}to{transform:rotate(360deg);}}
 body{
   width:100%;min-height:100vh;
   background:var(--dark3);
@@ -133,12 +292,19 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
 .trail{
   position:fixed;border-radius:50%;pointer-events:none;
   z-index:99990;transform:translate(-50%,-50%);
-  animation:trailFade .8s forwards;
+  left:var(--x);top:var(--y);font-size:var(--sz);
+  animation:trailFade .8s forwards;animation-duration:var(--d,.8s);
 }
 @keyframes trailFade{
   0%{opacity:.8;transform:translate(-50%,-50%) scale(1);}
   100%{opacity:0;transform:translate(-50%,-50%) scale(0);}
 }
+/* pooled trail nodes restart by flipping to an identical copy of the keyframes */
+.trail.alt{animation-name:trailFade2;}
+@keyframes trailFade2{
+  0%{opacity:.8;transform:translate(-50%,-50%) scale(1);}
+  100%{opacity:0;transform:translate(-50%,-50%) scale(0);}
+}
 
 /* ══ LOADING SCREEN ══ */
 #loader{
@@ -157,17 +323,12 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
   background:linear-gradient(to bottom,var(--pk),var(--pp));
   border-radius:50% 50% 50% 50%/60% 60% 40% 40%;
   transform-origin:8px 60px;
+  --r:calc(var(--i) * 45deg);
+  transform:rotate(var(--r)) translateY(-60px);
   animation:petalSpin 1.5s ease-in-out infinite;
+  animation-delay:calc(var(--i) * .1s);
   box-shadow:0 0 10px var(--pk);
 }
-.loader-petal:nth-child(1){transform:rotate(0deg) translateY(-60px);animation-delay:0s;}
-.loader-petal:nth-child(2){transform:rotate(45deg) translateY(-60px);animation-delay:.1s;}
-.loader-petal:nth-child(3){transform:rotate(90deg) translateY(-60px);animation-delay:.2s;}
-.loader-petal:nth-child(4){transform:rotate(135deg) translateY(-60px);animation-delay:.3s;}
-.loader-petal:nth-child(5){transform:rotate(180deg) translateY(-60px);animation-delay:.4s;}
-.loader-petal:nth-child(6){transform:rotate(225deg) translateY(-60px);animation-delay:.5s;}
-.loader-petal:nth-child(7){transform:rotate(270deg) translateY(-60px);animation-delay:.6s;}
-.loader-petal:nth-child(8){transform:rotate(315deg) translateY(-60px);animation-delay:.7s;}
 .loader-center{
   position:absolute;top:50%;left:50%;
   width:24px;height:24px;
@@ -197,12 +358,12 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
   background:rgba(255,255,255,0.1);border-radius:2px;overflow:hidden;
 }
 .loader-bar{
-  height:100%;width:0%;
+  height:100%;width:100%;
   background:linear-gradient(90deg,var(--pk),var(--pp),var(--rd),var(--pk));
   background-size:300%;
   border-radius:2px;
   animation:barGlow 1s linear infinite;
-  transition:width .1s linear;
+  transform:scaleX(0);transform-origin:left center;will-change:transform;
 }
 @keyframes barGlow{0%{background-position:0%;}100%{background-position:300%;}}
 
@@ -238,10 +399,12 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
 }
 
 /* ══ FLOATING PARTICLES ══ */
-#particles{position:fixed;inset:0;z-index:1;pointer-events:none;overflow:hidden;}
+#particles{position:fixed;inset:0;z-index:1;pointer-events:none;overflow:hidden;contain:strict;}
 .fp{
   position:absolute;
   animation:fpRise linear infinite;
+  will-change:transform,opacity;
+  text-shadow:0 0 6px rgba(255,130,180,.6);
   opacity:0;
 }
 @keyframes fpRise{
@@ -274,7 +437,8 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
 .crown{
   font-size:clamp(2rem,5vw,3.5rem);
   animation:crownFloat 3s ease-in-out infinite;
-  filter:drop-shadow(0 0 20px var(--gold));
+  will-change:transform;
+  text-shadow:0 0 20px var(--gold);
   margin-bottom:10px;display:block;
 }
 @keyframes crownFloat{
@@ -292,6 +456,7 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
   position:absolute;
   border-radius:50%;
   animation:ringPulse 2s ease-in-out infinite;
+  will-change:transform,opacity;
 }
 .agr1{
   width:calc(var(--as) + 40px);height:calc(var(--as) + 40px);
@@ -324,6 +489,7 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
     inset 0 0 30px rgba(255,255,255,.05);
   position:relative;z-index:2;
   animation:avatarFloat 4s ease-in-out infinite;
+  will-change:transform;
   transition:transform .4s,box-shadow .4s;
 }
 .avatar-img:hover{
@@ -359,12 +525,12 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
   background:linear-gradient(90deg,var(--pp2),var(--pk),var(--rd2));
   -webkit-background-clip:text;-webkit-text-fill-color:transparent;
   background-clip:text;
-  display:block;margin-bottom:15px;
+  display:block;margin-bottom:15px;letter-spacing:.05em;
   animation:subtitleWave 3s ease-in-out infinite;
 }
 @keyframes subtitleWave{
-  0%,100%{letter-spacing:.05em;}
-  50%{letter-spacing:.15em;}
+  0%,100%{transform:scaleX(1);}
+  50%{transform:scaleX(1.08);}
 }
 .hero-tagline{
   font-family:'Cormorant Garamond',serif;
@@ -405,12 +571,11 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
 .soc-btn{
   display:flex;align-items:center;justify-content:center;
   width:48px;height:48px;border-radius:16px;
-  background:var(--glass2);
+  background:var(--glass-solid);
   border:1px solid var(--border);
   color:#fff;font-size:1.1rem;
   text-decoration:none;
   transition:all .3s cubic-bezier(.34,1.56,.64,1);
-  backdrop-filter:blur(12px);
   position:relative;overflow:hidden;
 }
 .soc-btn::before{
@@ -418,7 +583,7 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
   background:linear-gradient(135deg,var(--pk),var(--pp));
   opacity:0;transition:opacity .3s;
 }
-.soc-btn i{position:relative;z-index:1;}
+.soc-btn .ic{position:relative;z-index:1;}
 .soc-btn:hover{
   transform:translateY(-8px) scale(1.15) rotate(-5deg);
   border-color:var(--pk);
@@ -441,8 +606,8 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
   animation:introFlowers 2s ease-in-out infinite;
 }
 @keyframes introFlowers{
-  0%,100%{gap:20px;}
-  50%{gap:30px;}
+  0%,100%{transform:scale(1);}
+  50%{transform:scale(1.1);}
 }
 .intro-typing{
   font-family:'Dancing Script',cursive;
@@ -521,14 +686,13 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
   content:'';position:absolute;
   top:-50%;left:-50%;width:200%;height:200%;
   background:conic-gradient(transparent 0deg,rgba(255,255,255,.15) 180deg,transparent 360deg);
-  animation:btnSweep 2s linear infinite;
+  animation:spin 2s linear infinite;
 }
 @keyframes btnGrad{0%,100%{background-position:0%;}50%{background-position:100%;}}
 @keyframes btnEntPulse{
   0%,100%{box-shadow:0 0 40px rgba(255,77,141,.5),0 20px 60px rgba(185,79,204,.3);}
   50%{box-shadow:0 0 80px rgba(255,77,141,.9),0 30px 80px rgba(185,79,204,.6),0 0 120px rgba(232,48,90,.4);}
 }
-@keyframes btnSweep{from{transform:rotate(0deg);}to{transform:rotate(360deg);}}
 
 /* ── Enter floating hearts ── */
 .enter-hearts{
@@ -536,12 +700,12 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
   animation:enterHeartsAnim 2s ease-in-out infinite;
 }
 @keyframes enterHeartsAnim{
-  0%,100%{transform:scale(1);gap:15px;}
-  50%{transform:scale(1.1);gap:25px;}
+  0%,100%{transform:scale(1);}
+  50%{transform:scale(1.1);}
 }
 
 /* ══ BIO CARDS SECTION ══ */
-.bio-section{padding:40px 20px 80px;max-width:1000px;margin:0 auto;}
+.bio-section{padding:40px 20px 80px;max-width:1000px;margin:0 auto;content-visibility:auto;contain-intrinsic-size:auto 1200px;}
 
 .section-heading{
   text-align:center;margin-bottom:40px;
@@ -568,15 +732,17 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
 
 .bio-card{
   position:relative;overflow:hidden;
-  background:var(--glass);
+  background:var(--glass-solid);
   border:1px solid var(--border);
   border-radius:24px;
   padding:clamp(18px,3vw,28px);
   cursor:pointer;
-  backdrop-filter:blur(20px);
   transition:all .4s cubic-bezier(.34,1.56,.64,1);
   animation:cardIn .6s both;
+  animation-delay:calc(var(--i,0) * .05s);
   -webkit-tap-highlight-color:transparent;
+  /* hover/playing restyles stay inside the card instead of dirtying the whole grid */
+  contain:layout paint style;
 }
 .bio-card::before{
   content:'';position:absolute;inset:0;
@@ -591,7 +757,7 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
     rgba(255,130,180,.08) 90deg,
     transparent 180deg
   );
-  animation:cardRotate 6s linear infinite;
+  animation:spin 6s linear infinite;
   opacity:0;transition:opacity .3s;
 }
 .bio-card:hover{
@@ -610,7 +776,6 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
   from{opacity:0;transform:translateY(40px) scale(.9);}
   to{opacity:1;transform:translateY(0) scale(1);}
 }
-@keyframes cardRotate{from{transform:rotate(0deg);}to{transform:rotate(360deg);}}
 
 .card-top{display:flex;align-items:center;gap:10px;margin-bottom:14px;}
 .card-icon-wrap{
@@ -678,7 +843,8 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
 #popup{
   position:fixed;inset:0;z-index:20000;
   display:none;align-items:center;justify-content:center;
-  background:rgba(10,0,20,.85);backdrop-filter:blur(20px);
+  background:rgba(10,0,20,.9);
+  contain:layout paint style;
 }
 #popup.show{display:flex;}
 .popup-box{
@@ -725,7 +891,7 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
 /* ══ MUSIC WIDGET ══ */
 #music-widget{
   position:fixed;bottom:20px;left:20px;z-index:500;
-  background:rgba(45,0,53,.85);backdrop-filter:blur(20px);
+  background:rgba(45,0,53,.9);
   border:1px solid rgba(255,130,180,.25);
   border-radius:20px;padding:10px 18px;
   display:none;align-items:center;gap:12px;
@@ -736,10 +902,10 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
 #music-widget:hover{border-color:rgba(255,77,141,.5);box-shadow:0 12px 40px rgba(255,77,141,.4);}
 .mw-icon{
   font-size:1.1rem;color:var(--pk);
-  animation:musicSpin 2s linear infinite;
+  animation:spin 2s linear infinite;
+  will-change:transform;
 }
 .mw-icon.paused{animation-play-state:paused;}
-@keyframes musicSpin{from{transform:rotate(0);}to{transform:rotate(360deg);}}
 .mw-bars{display:flex;gap:3px;align-items:flex-end;height:18px;}
 .mw-bar{
   width:3px;border-radius:2px;
@@ -761,8 +927,9 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
 .rose-corner{
   position:fixed;font-size:clamp(1.5rem,3vw,2.5rem);
   pointer-events:none;z-index:3;
-  filter:drop-shadow(0 0 15px rgba(255,77,141,.5));
+  text-shadow:0 0 15px rgba(255,77,141,.5);
   animation:roseFloat 4s ease-in-out infinite;
+  will-change:transform;
 }
 .rc-tl{top:15px;left:15px;animation-delay:0s;}
 .rc-tr{top:15px;right:15px;animation-delay:1s;transform:scaleX(-1);}
@@ -786,13 +953,37 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
 /* ══ RIPPLE ══ */
 .ripple{
   position:fixed;border-radius:50%;pointer-events:none;z-index:99997;
-  transform:translate(-50%,-50%) scale(0);
+  left:var(--x);top:var(--y);width:60px;height:60px;
+  transform:translate(-50%,-50%) scale(0);opacity:0;
   animation:rippleAnim .6s ease-out forwards;
   border:2px solid rgba(255,130,180,.6);
 }
 @keyframes rippleAnim{
+  from{opacity:1;}
   to{transform:translate(-50%,-50%) scale(4);opacity:0;}
 }
+.ripple.alt{animation-name:rippleAnim2;}
+@keyframes rippleAnim2{
+  from{opacity:1;}
+  to{transform:translate(-50%,-50%) scale(4);opacity:0;}
+}
+.burst{
+  position:fixed;left:0;top:0;pointer-events:none;z-index:99999;
+  --x:0px;--y:0px;font-size:var(--sz);opacity:0;will-change:transform,opacity;
+  animation:burstAnim .8s ease forwards;
+}
+/* pooled: restart by flipping to an identical copy of the keyframes */
+.burst.alt{animation-name:burstAnim2;}
+@keyframes burstAnim{
+  0%{opacity:1;transform:translate3d(calc(var(--x) - 50%),calc(var(--y) - 50%),0) scale(0);}
+  40%{opacity:1;transform:translate3d(calc(var(--x) - 50% + var(--tx)*.4),calc(var(--y) - 50% + var(--ty)*.4),0) scale(1.2);}
+  100%{opacity:0;transform:translate3d(calc(var(--x) - 50% + var(--tx)),calc(var(--y) - 50% + var(--ty)),0) scale(0);}
+}
+@keyframes burstAnim2{
+  0%{opacity:1;transform:translate3d(calc(var(--x) - 50%),calc(var(--y) - 50%),0) scale(0);}
+  40%{opacity:1;transform:translate3d(calc(var(--x) - 50% + var(--tx)*.4),calc(var(--y) - 50% + var(--ty)*.4),0) scale(1.2);}
+  100%{opacity:0;transform:translate3d(calc(var(--x) - 50% + var(--tx)),calc(var(--y) - 50% + var(--ty)),0) scale(0);}
+}
 
 /* ══ RESPONSIVE ══ */
 @media(max-width:480px){
@@ -826,19 +1017,19 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
 {% endif %}
 
 <!-- Particles -->
-<div id="particles"></div>
+<div id="particles">{% for emoji, left, size, dur, delay in particles %}<div class="fp" style="left:{{ left }}vw;font-size:{{ size }}rem;animation-duration:{{ dur }}s;animation-delay:{{ delay }}s">{{ emoji }}</div>{% endfor %}</div>
 
 <!-- ══ LOADER ══ -->
 <div id="loader">
   <div class="loader-petals">
-    <div class="loader-petal"></div>
-    <div class="loader-petal"></div>
-    <div class="loader-petal"></div>
-    <div class="loader-petal"></div>
-    <div class="loader-petal"></div>
-    <div class="loader-petal"></div>
-    <div class="loader-petal"></div>
-    <div class="loader-petal"></div>
+    <div class="loader-petal" style="--i:0"></div>
+    <div class="loader-petal" style="--i:1"></div>
+    <div class="loader-petal" style="--i:2"></div>
+    <div class="loader-petal" style="--i:3"></div>
+    <div class="loader-petal" style="--i:4"></div>
+    <div class="loader-petal" style="--i:5"></div>
+    <div class="loader-petal" style="--i:6"></div>
+    <div class="loader-petal" style="--i:7"></div>
     <div class="loader-center"></div>
   </div>
   <div class="loader-text" id="loader-text">🌸 Loading her world...</div>
@@ -892,11 +1083,11 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
     </div>
 
     <div class="social-row">
-      {% if socials.instagram %}<a href="{{ socials.instagram }}" target="_blank" class="soc-btn" title="Instagram"><i class="fab fa-instagram"></i></a>{% endif %}
-      {% if socials.twitter %}<a href="{{ socials.twitter }}" target="_blank" class="soc-btn" title="Twitter"><i class="fab fa-twitter"></i></a>{% endif %}
-      {% if socials.tiktok %}<a href="{{ socials.tiktok }}" target="_blank" class="soc-btn" title="TikTok"><i class="fab fa-tiktok"></i></a>{% endif %}
-      {% if socials.youtube %}<a href="{{ socials.youtube }}" target="_blank" class="soc-btn" title="YouTube"><i class="fab fa-youtube"></i></a>{% endif %}
-      {% if socials.snapchat %}<a href="{{ socials.snapchat }}" target="_blank" class="soc-btn" title="Snapchat"><i class="fab fa-snapchat"></i></a>{% endif %}
+      {% if socials.instagram %}<a href="{{ socials.instagram }}" target="_blank" class="soc-btn" title="Instagram"><svg class="ic"><use href="#i-instagram"/></svg></a>{% endif %}
+      {% if socials.twitter %}<a href="{{ socials.twitter }}" target="_blank" class="soc-btn" title="Twitter"><svg class="ic"><use href="#i-twitter"/></svg></a>{% endif %}
+      {% if socials.tiktok %}<a href="{{ socials.tiktok }}" target="_blank" class="soc-btn" title="TikTok"><svg class="ic"><use href="#i-tiktok"/></svg></a>{% endif %}
+      {% if socials.youtube %}<a href="{{ socials.youtube }}" target="_blank" class="soc-btn" title="YouTube"><svg class="ic"><use href="#i-youtube"/></svg></a>{% endif %}
+      {% if socials.snapchat %}<a href="{{ socials.snapchat }}" target="_blank" class="soc-btn" title="Snapchat"><svg class="ic"><use href="#i-snapchat"/></svg></a>{% endif %}
     </div>
 
     <p style="font-family:'Cormorant Garamond',serif;font-style:italic;font-size:clamp(.85rem,2vw,1.05rem);color:rgba(255,200,220,.65);max-width:460px;line-height:1.8;margin-top:10px;">{{ p.bio }}</p>
@@ -908,88 +1099,18 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
       <h2>✨ Know Her Better ✨</h2>
       <p>tap a card to unveil a little secret 🌸</p>
     </div>
-    <div class="bio-grid">
+    <div class="bio-grid" id="bio-grid">
 
-      <div class="bio-card" onclick="cardClick('age',this,event)" style="animation-delay:.05s">
-        <div class="card-top">
-          <div class="card-icon-wrap">✨</div>
-          <div class="card-label">Age</div>
+      {% for cat, icon, label, _, _ in cards %}
+      <div class="bio-card{% if cat == 'quote' %} card-quote{% endif %}" data-cat="{{ cat }}" style="--i:{{ loop.index }}">
+        <div class="card-top"{% if cat == 'quote' %} style="justify-content:center;"{% endif %}>
+          <div class="card-icon-wrap">{{ icon }}</div>
+          <div class="card-label">{{ label }}</div>
         </div>
-        <div class="card-value">{{ p.age }}</div>
-        <div class="card-play-hint"><i class="fas fa-play"></i> tap</div>
-      </div>
-
-      <div class="bio-card" onclick="cardClick('birthday',this,event)" style="animation-delay:.1s">
-        <div class="card-top">
-          <div class="card-icon-wrap">🎂</div>
-          <div class="card-label">Birthday</div>
-        </div>
-        <div class="card-value">{{ p.birthday }}</div>
-        <div class="card-play-hint"><i class="fas fa-play"></i> tap</div>
-      </div>
-
-      <div class="bio-card" onclick="cardClick('location',this,event)" style="animation-delay:.15s">
-        <div class="card-top">
-          <div class="card-icon-wrap">🌍</div>
-          <div class="card-label">Location</div>
-        </div>
-        <div class="card-value">{{ p.location }}</div>
-        <div class="card-play-hint"><i class="fas fa-play"></i> tap</div>
-      </div>
-
-      <div class="bio-card" onclick="cardClick('zodiac',this,event)" style="animation-delay:.2s">
-        <div class="card-top">
-          <div class="card-icon-wrap">🌙</div>
-          <div class="card-label">Zodiac</div>
-        </div>
-        <div class="card-value">{{ p.zodiac }}</div>
-        <div class="card-play-hint"><i class="fas fa-play"></i> tap</div>
-      </div>
-
-      <div class="bio-card" onclick="cardClick('hobbies',this,event)" style="animation-delay:.25s">
-        <div class="card-top">
-          <div class="card-icon-wrap">🎨</div>
-          <div class="card-label">Hobbies</div>
-        </div>
-        <div class="card-value">{{ p.hobbies }}</div>
-        <div class="card-play-hint"><i class="fas fa-play"></i> tap</div>
-      </div>
-
-      <div class="bio-card" onclick="cardClick('music',this,event)" style="animation-delay:.3s">
-        <div class="card-top">
-          <div class="card-icon-wrap">🎵</div>
-          <div class="card-label">Music</div>
-        </div>
-        <div class="card-value">{{ p.music }}</div>
-        <div class="card-play-hint"><i class="fas fa-play"></i> tap</div>
-      </div>
-
-      <div class="bio-card" onclick="cardClick('vibe',this,event)" style="animation-delay:.35s">
-        <div class="card-top">
-          <div class="card-icon-wrap">🌙</div>
-          <div class="card-label">My Vibe</div>
-        </div>
-        <div class="card-value">{{ p.vibe }}</div>
-        <div class="card-play-hint"><i class="fas fa-play"></i> tap</div>
-      </div>
-
-      <div class="bio-card" onclick="cardClick('bestie',this,event)" style="animation-delay:.4s">
-        <div class="card-top">
-          <div class="card-icon-wrap">💗</div>
-          <div class="card-label">Bestie</div>
-        </div>
-        <div class="card-value">{{ p.bestie }}</div>
-        <div class="card-play-hint"><i class="fas fa-play"></i> tap</div>
-      </div>
-
-      <div class="bio-card card-quote" onclick="cardClick('quote',this,event)" style="animation-delay:.45s">
-        <div class="card-top" style="justify-content:center;">
-          <div class="card-icon-wrap">🦋</div>
-          <div class="card-label">Her Quote</div>
-        </div>
-        <div class="card-value">{{ p.quote }}</div>
-        <div class="card-play-hint"><i class="fas fa-play"></i> tap</div>
+        <div class="card-value">{{ p|attr(cat) }}</div>
+        <div class="card-play-hint"><svg class="ic"><use href="#i-play"/></svg> tap</div>
       </div>
+      {% endfor %}
 
     </div>
   </div>
@@ -1008,10 +1129,15 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
     <div class="popup-media" id="popup-media"></div>
   </div>
 </div>
+<!-- popup bodies, parsed once and cloned per open -->
+<template id="tpl-none"><div class="no-media"><span class="nm-icon">🌸</span>No media assigned yet~<br><small style="opacity:.5">Add one in the admin panel 💕</small></div></template>
+<template id="tpl-youtube"><iframe allow="autoplay;encrypted-media" allowfullscreen></iframe></template>
+<template id="tpl-video"><video controls autoplay></video></template>
+<template id="tpl-audio"><div style="text-align:center;padding:20px 0;"><div style="font-size:2.5rem;margin-bottom:14px;animation:heartBeat 1s ease-in-out infinite;">🎵</div><audio controls autoplay></audio></div></template>
 
 <!-- Music Widget -->
 <div id="music-widget" onclick="toggleMusic()">
-  <i class="fas fa-compact-disc mw-icon" id="mw-icon"></i>
+  <svg class="ic mw-icon" id="mw-icon"><use href="#i-disc"/></svg>
   <div class="mw-bars" id="mw-bars">
     <div class="mw-bar"></div>
     <div class="mw-bar"></div>
@@ -1022,15 +1148,14 @@ body:has(.bio-card:hover) #cursor{width:30px;height:30px;background:var(--pp);}
   <div class="mw-text" id="mw-text">MUSIC</div>
 </div>
 
-<audio id="bg-audio" loop>
-  {% if bg_music %}<source src="{{ bg_music }}">{% endif %}
-</audio>
+<!-- fetched only once the visitor enters (doEnter), not during the loader/intro -->
+<audio id="bg-audio" loop preload="none"{% if bg_music %} data-src="{{ bg_music }}"{% endif %}></audio>
 
 <script>
 // ════════════════════════════════
 // DATA
 // ════════════════════════════════
-const MEDIA = {{ media_map | tojson }};
+const MEDIA = {{ media | tojson }};
 const INTRO_LINES = {{ intro_lines | tojson }};
 const HAS_MUSIC = {{ 'true' if bg_music else 'false' }};
 const CARD_LABELS = {
@@ -1039,96 +1164,110 @@ const CARD_LABELS = {
   hobbies:'🎨 Her Hobbies',music:'🎵 Music Taste',
   vibe:'🌸 Her Vibe',bestie:'💗 Bestie Love',quote:'🦋 Her Quote'
 };
+// element refs looked up once; the script runs after the markup, so everything already exists
+const $={
+  loader:document.getElementById('loader'),intro:document.getElementById('intro'),
+  introTyping:document.getElementById('intro-typing'),enterScreen:document.getElementById('enter-screen'),
+  popup:document.getElementById('popup'),popupTitle:document.getElementById('popup-title'),
+  popupMedia:document.getElementById('popup-media'),bioGrid:document.getElementById('bio-grid'),
+  bgVideo:document.getElementById('bg-video'),bgAudio:document.getElementById('bg-audio'),
+  musicWidget:document.getElementById('music-widget'),mwIcon:document.getElementById('mw-icon'),
+  mwBars:document.getElementById('mw-bars'),mwText:document.getElementById('mw-text'),
+  cursor:document.getElementById('cursor'),cursorRing:document.getElementById('cursor-ring'),
+  site:document.getElementById('site'),loaderBar:document.getElementById('loader-bar'),
+  loaderText:document.getElementById('loader-text'),
+  tpl:{none:document.getElementById('tpl-none'),youtube:document.getElementById('tpl-youtube'),
+       video:document.getElementById('tpl-video'),audio:document.getElementById('tpl-audio')}
+};
 
 // ════════════════════════════════
 // CURSOR
 // ════════════════════════════════
-const cur = document.getElementById('cursor');
-const curR = document.getElementById('cursor-ring');
 let mx=0,my=0,rx=0,ry=0;
+// the trail and burst spawners draw from a table filled once, instead of several Math.random() calls per node
+const RND=new Float64Array(1024);
+for(let i=0;i<1024;i++) RND[i]=Math.random();
+let rndIdx=0;
+const rnd=()=>RND[rndIdx=(rndIdx+1)&1023];
+// Trail: a fixed ring of nodes reused round-robin instead of create/remove per sparkle
+const TRAIL_EMOJIS=['✨','💕','🌸','⭐','♡'];
+const trailPool=[];let trailIdx=0;
+for(let i=0;i<16;i++){
+  const t=document.createElement('div');
+  t.className='trail';
+  trailPool.push(document.body.appendChild(t));
+}
+function spawnTrail(x,y){
+  const t=trailPool[trailIdx];trailIdx=(trailIdx+1)%trailPool.length;
+  t.textContent=TRAIL_EMOJIS[Math.floor(rnd()*TRAIL_EMOJIS.length)];
+  const st=t.style;
+  st.setProperty('--x',x+'px');st.setProperty('--y',y+'px');
+  st.setProperty('--sz',(.6+rnd()*.6)+'rem');st.setProperty('--d',(.5+rnd()*.4)+'s');
+  t.classList.toggle('alt');
+}
+// pointers can fire mousemove well above the refresh rate; act on the latest position once per frame
+let moveQueued=false;
+function onMoveFrame(){
+  moveQueued=false;
+  $.cursor.style.left=mx+'px';$.cursor.style.top=my+'px';
+  if(!ringRunning){ringRunning=true;requestAnimationFrame(ringStep);}
+  if($.site.classList.contains('show') && rnd()>.7) spawnTrail(mx,my);
+}
 document.addEventListener('mousemove',e=>{
   mx=e.clientX;my=e.clientY;
-  cur.style.left=mx+'px';cur.style.top=my+'px';
-  // Trail
-  if(document.getElementById('site').classList.contains('show') && Math.random()>.7){
-    const t=document.createElement('div');
-    t.className='trail';
-    const emj=['✨','💕','🌸','⭐','♡'];
-    t.textContent=emj[Math.floor(Math.random()*emj.length)];
-    t.style.cssText=`left:${mx}px;top:${my}px;font-size:${.6+Math.random()*.6}rem;animation-duration:${.5+Math.random()*.4}s;`;
-    document.body.appendChild(t);
-    setTimeout(()=>t.remove(),900);
-  }
-});
-setInterval(()=>{
+  if(!moveQueued){moveQueued=true;requestAnimationFrame(onMoveFrame);}
+},{passive:true});
+// the ring eases toward the pointer once per frame, and the loop stops once it has caught up
+let ringRunning=false;
+function ringStep(){
   rx+=(mx-rx)*.1;ry+=(my-ry)*.1;
-  curR.style.left=rx+'px';curR.style.top=ry+'px';
-},16);
+  $.cursorRing.style.left=rx+'px';$.cursorRing.style.top=ry+'px';
+  if(Math.abs(mx-rx)>.5||Math.abs(my-ry)>.5) requestAnimationFrame(ringStep);
+  else ringRunning=false;
+}
 
-// Click ripple
-document.addEventListener('click',e=>{
+// Click ripple: a few reusable nodes, so a click costs no node creation or removal timer
+const ripplePool=[];let rippleIdx=0;
+for(let i=0;i<4;i++){
   const r=document.createElement('div');
   r.className='ripple';
-  r.style.cssText=`left:${e.clientX}px;top:${e.clientY}px;width:60px;height:60px;`;
-  document.body.appendChild(r);
-  setTimeout(()=>r.remove(),700);
-});
-
-// ════════════════════════════════
-// PARTICLES
-// ════════════════════════════════
-const EMOJIS=['🌸','💕','✨','🌹','💗','⭐','🦋','💜','🌙','💖','🌺','✿','♡','💫','🎀'];
-function makeParticle(){
-  const p=document.createElement('div');
-  p.className='fp';
-  p.textContent=EMOJIS[Math.floor(Math.random()*EMOJIS.length)];
-  const size=.5+Math.random()*1.2;
-  const dur=8+Math.random()*15;
-  p.style.cssText=`
-    left:${Math.random()*100}vw;
-    font-size:${size}rem;
-    animation-duration:${dur}s;
-    animation-delay:${Math.random()*dur}s;
-    filter:drop-shadow(0 0 6px rgba(255,130,180,.6));
-  `;
-  document.getElementById('particles').appendChild(p);
-  setTimeout(()=>p.remove(),(dur+5)*1000);
-}
-for(let i=0;i<30;i++) setTimeout(makeParticle,i*200);
-setInterval(makeParticle,1200);
+  ripplePool.push(document.body.appendChild(r));
+}
+document.addEventListener('click',e=>{
+  const r=ripplePool[rippleIdx];rippleIdx=(rippleIdx+1)%ripplePool.length;
+  r.style.setProperty('--x',e.clientX+'px');r.style.setProperty('--y',e.clientY+'px');
+  r.classList.toggle('alt');
+},{passive:true});
 
 // ════════════════════════════════
 // LOADER
 // ════════════════════════════════
 const loaderMsgs=['🌸 Loading her world...','💕 Sprinkling love...','✨ Waking up magic...','🌹 Almost ready...','💗 Here she comes!'];
-let lp=0;
-const lb=document.getElementById('loader-bar');
-const lt=document.getElementById('loader-text');
-let lw=0;
-const lInt=setInterval(()=>{
-  lw+=Math.random()*3+1.5;
-  if(lw>100)lw=100;
-  lb.style.width=lw+'%';
-  const mi=Math.floor((lw/100)*loaderMsgs.length);
-  lt.textContent=loaderMsgs[Math.min(mi,loaderMsgs.length-1)];
-  if(lw>=100){
-    clearInterval(lInt);
-    setTimeout(()=>{
-      document.getElementById('loader').style.transition='opacity .6s';
-      document.getElementById('loader').style.opacity='0';
-      setTimeout(startIntro,700);
-    },400);
-  }
-},80);
+const LOADER_MS=2700;
+let lt0=0,lastMsg=-1;
+// scaleX on a full-width bar stays on the compositor; text only changes when the message does
+function loaderStep(ts){
+  if(!lt0)lt0=ts;
+  const p=Math.min(1,(ts-lt0)/LOADER_MS);
+  $.loaderBar.style.transform=`scaleX(${p})`;
+  const mi=Math.min(Math.floor(p*loaderMsgs.length),loaderMsgs.length-1);
+  if(mi!==lastMsg){$.loaderText.textContent=loaderMsgs[mi];lastMsg=mi;}
+  if(p<1){requestAnimationFrame(loaderStep);return;}
+  setTimeout(()=>{
+    $.loader.style.transition='opacity .6s';
+    $.loader.style.opacity='0';
+    setTimeout(startIntro,700);
+  },400);
+}
+requestAnimationFrame(loaderStep);
 
 // ════════════════════════════════
 // INTRO TYPING
 // ════════════════════════════════
 let introSkipped=false;
 function startIntro(){
-  document.getElementById('loader').style.display='none';
-  const intro=document.getElementById('intro');
-  intro.style.display='flex';
+  $.loader.style.display='none';
+  $.intro.style.display='flex';
   typeIntroLines(0);
 }
 
@@ -1139,32 +1278,42 @@ async function typeIntroLines(idx){
     if(!introSkipped) showEnterScreen();
     return;
   }
-  const el=document.getElementById('intro-typing');
+  const el=$.introTyping;
   const line=INTRO_LINES[idx];
   el.innerHTML='<span class="typing-cursor">|</span>';
-  let i=0;
+  const txt=el.insertBefore(document.createTextNode(''),el.firstChild);
+  // one rAF loop per line: append whatever characters are due (one per 45ms) in a single write per frame
   await new Promise(res=>{
-    const t=setInterval(()=>{
-      if(introSkipped){clearInterval(t);res();return;}
-      el.innerHTML=line.slice(0,++i)+'<span class="typing-cursor">|</span>';
-      if(i>=line.length){clearInterval(t);setTimeout(res,700);}
-    },45);
+    let start=0,shown=0;
+    function tick(ts){
+      if(introSkipped){res();return;}
+      if(!start)start=ts;
+      const due=Math.min(line.length,Math.floor((ts-start)/45));
+      if(due>shown){txt.appendData(line.slice(shown,due));shown=due;}
+      if(shown>=line.length){sleep(700).then(res);return;}
+      requestAnimationFrame(tick);
+    }
+    requestAnimationFrame(tick);
   });
   await sleep(300);
   typeIntroLines(idx+1);
 }
 
+// pending pauses resolve at once so the typing chain unwinds now
 function skipIntro(){
+  if(introSkipped)return;
   introSkipped=true;
-  document.getElementById('intro').classList.add('hide');
+  for(const [t,r] of sleeps){clearTimeout(t);r();}
+  sleeps.clear();
+  $.intro.classList.add('hide');
   setTimeout(showEnterScreen,500);
 }
 
 function showEnterScreen(){
-  document.getElementById('intro').classList.add('hide');
+  $.intro.classList.add('hide');
   setTimeout(()=>{
-    document.getElementById('intro').style.display='none';
-    document.getElementById('enter-screen').classList.add('show');
+    $.intro.style.display='none';
+    $.enterScreen.classList.add('show');
   },400);
 }
 
@@ -1174,14 +1323,15 @@ function showEnterScreen(){
 function doEnter(){
   // Start music
   if(HAS_MUSIC){
-    const a=document.getElementById('bg-audio');
+    const a=$.bgAudio;
+    a.src=a.dataset.src;
     a.volume=.4;
     a.play().catch(()=>{});
     isMusicOn=true;
-    document.getElementById('music-widget').classList.add('show');
+    $.musicWidget.classList.add('show');
   }
   // Animate enter screen out
-  const es=document.getElementById('enter-screen');
+  const es=$.enterScreen;
   es.style.transition='opacity .8s ease,transform .8s ease';
   es.style.opacity='0';
   es.style.transform='scale(1.1)';
@@ -1192,8 +1342,7 @@ function doEnter(){
 }
 
 function revealSite(){
-  const site=document.getElementById('site');
-  site.classList.add('show');
+  $.site.classList.add('show');
 }
 
 // ════════════════════════════════
@@ -1207,41 +1356,26 @@ function cardClick(cat,el,ev){
 
   if(activeCard && activeCard!==el) activeCard.classList.remove('playing');
 
-  const url=MEDIA[cat]||'';
-  showPopup(cat,url,el);
+  showPopup(cat,MEDIA[cat],el);
 }
 
-function showPopup(cat,url,cardEl){
-  const pop=document.getElementById('popup');
-  const title=document.getElementById('popup-title');
-  const media=document.getElementById('popup-media');
+function ytEmbed(id){return `https://www.youtube.com/embed/${id}?autoplay=1&rel=0`;}
 
-  title.textContent=CARD_LABELS[cat]||('💕 '+cat);
+function showPopup(cat,m,cardEl){
+  $.popupTitle.textContent=CARD_LABELS[cat]||('💕 '+cat);
 
   if(activeAudio){activeAudio.pause();activeAudio=null;}
 
-  if(!url){
-    media.innerHTML=`
-      <div class="no-media">
-        <span class="nm-icon">🌸</span>
-        No media assigned yet~<br>
-        <small style="opacity:.5">Add one in the admin panel 💕</small>
-      </div>`;
-  } else if(url.includes('youtube.com')||url.includes('youtu.be')){
-    const vid=ytId(url);
-    media.innerHTML=`<iframe src="https://www.youtube.com/embed/${vid}?autoplay=1&rel=0" allow="autoplay;encrypted-media" allowfullscreen></iframe>`;
-  } else if(/\.(mp4|webm|mov)(\?|$)/i.test(url)){
-    media.innerHTML=`<video controls autoplay><source src="${url}"></video>`;
-  } else {
-    media.innerHTML=`
-      <div style="text-align:center;padding:20px 0;">
-        <div style="font-size:2.5rem;margin-bottom:14px;animation:heartBeat 1s ease-in-out infinite;">🎵</div>
-        <audio controls autoplay id="popAudio"><source src="${url}"></audio>
-      </div>`;
-    setTimeout(()=>{const a=document.getElementById('popAudio');if(a)activeAudio=a;},100);
+  // importNode (not content.cloneNode) so the media element belongs to this document before src is set
+  const body=document.importNode($.tpl[m?m.k:'none'].content,true);
+  if(m){
+    const el=body.querySelector('iframe,video,audio');
+    el.src=m.k==='youtube'?ytEmbed(m.id):m.u;
+    if(m.k==='audio') activeAudio=el;
   }
+  $.popupMedia.replaceChildren(body);
 
-  pop.classList.add('show');
+  $.popup.classList.add('show');
   if(cardEl){
     if(activeCard) activeCard.classList.remove('playing');
     activeCard=cardEl;
@@ -1250,89 +1384,129 @@ function showPopup(cat,url,cardEl){
 }
 
 function closePopup(){
-  document.getElementById('popup').classList.remove('show');
+  $.popup.classList.remove('show');
   if(activeAudio){activeAudio.pause();activeAudio=null;}
   if(activeCard){activeCard.classList.remove('playing');activeCard=null;}
 }
-document.getElementById('popup').addEventListener('click',function(e){
+$.popup.addEventListener('click',function(e){
   if(e.target===this) closePopup();
-});
-
-function ytId(url){
-  const m=url.match(/(?:v=|\/embed\/|youtu\.be\/)([a-zA-Z0-9_-]{11})/);
-  return m?m[1]:'';
-}
+},{passive:true});
+// one delegated listener for all cards instead of an inline handler on each
+$.bioGrid.addEventListener('click',e=>{
+  const card=e.target.closest('.bio-card');
+  if(card) cardClick(card.dataset.cat,card,e);
+},{passive:true});
+// hovering a YouTube card prefetches its embed page (same URL showPopup uses), once per video
+const warmedYt=new Set();
+$.bioGrid.addEventListener('pointerover',e=>{
+  const card=e.target.closest('.bio-card');
+  const m=card&&MEDIA[card.dataset.cat];
+  if(!m||m.k!=='youtube'||warmedYt.has(m.id))return;
+  warmedYt.add(m.id);
+  const l=document.createElement('link');
+  l.rel='prefetch';l.href=ytEmbed(m.id);
+  document.head.appendChild(l);
+},{passive:true});
 
 // ════════════════════════════════
 // SPARKLE BURST
 // ════════════════════════════════
 const B_EMOJIS=['✨','💕','🌸','⭐','💗','🦋','♡'];
+// two bursts' worth of nodes, created once; positioned with translate3d so nothing lays out
+const burstPool=[];let burstIdx=0;
+const burstFrag=document.createDocumentFragment();
+for(let i=0;i<24;i++){
+  const s=document.createElement('div');
+  s.className='burst';
+  burstPool.push(burstFrag.appendChild(s));
+}
+document.body.appendChild(burstFrag);
 function burst(x,y){
   for(let i=0;i<12;i++){
-    const s=document.createElement('div');
-    const angle=Math.random()*360;
-    const dist=40+Math.random()*80;
-    const rad=angle*Math.PI/180;
-    const tx=Math.cos(rad)*dist;
-    const ty=Math.sin(rad)*dist;
-    s.textContent=B_EMOJIS[Math.floor(Math.random()*B_EMOJIS.length)];
-    s.style.cssText=`
-      position:fixed;left:${x}px;top:${y}px;
-      pointer-events:none;z-index:99999;
-      font-size:${.7+Math.random()*.8}rem;
-      transform:translate(-50%,-50%);
-      animation:burstAnim .8s ease forwards;
-      --tx:${tx}px;--ty:${ty}px;
-    `;
-    document.body.appendChild(s);
-    setTimeout(()=>s.remove(),900);
+    const s=burstPool[burstIdx];burstIdx=(burstIdx+1)%burstPool.length;
+    const rad=rnd()*2*Math.PI;
+    const dist=40+rnd()*80;
+    s.textContent=B_EMOJIS[Math.floor(rnd()*B_EMOJIS.length)];
+    const st=s.style;
+    st.setProperty('--x',x+'px');st.setProperty('--y',y+'px');st.setProperty('--sz',(.7+rnd()*.8)+'rem');
+    st.setProperty('--tx',Math.cos(rad)*dist+'px');st.setProperty('--ty',Math.sin(rad)*dist+'px');
+    s.classList.toggle('alt');
   }
 }
 
-// Inject burst keyframes
-const bStyle=document.createElement('style');
-bStyle.textContent=`
-@keyframes burstAnim{
-  0%{opacity:1;transform:translate(-50%,-50%) scale(0);}
-  40%{opacity:1;transform:translate(calc(-50% + var(--tx)*.4),calc(-50% + var(--ty)*.4)) scale(1.2);}
-  100%{opacity:0;transform:translate(calc(-50% + var(--tx)),calc(-50% + var(--ty))) scale(0);}
-}`;
-document.head.appendChild(bStyle);
-
 // ════════════════════════════════
 // MUSIC WIDGET
 // ════════════════════════════════
 let isMusicOn=false;
 function toggleMusic(){
-  const a=document.getElementById('bg-audio');
-  const icon=document.getElementById('mw-icon');
-  const bars=document.getElementById('mw-bars');
-  const txt=document.getElementById('mw-text');
   if(isMusicOn){
-    a.pause();isMusicOn=false;
-    icon.classList.add('paused');
-    bars.style.opacity='.3';
-    txt.textContent='PAUSED';
+    $.bgAudio.pause();isMusicOn=false;
+    $.mwIcon.classList.add('paused');
+    $.mwBars.style.opacity='.3';
+    $.mwText.textContent='PAUSED';
   } else {
-    a.play().catch(()=>{});isMusicOn=true;
-    icon.classList.remove('paused');
-    bars.style.opacity='1';
-    txt.textContent='MUSIC';
+    $.bgAudio.play().catch(()=>{});isMusicOn=true;
+    $.mwIcon.classList.remove('paused');
+    $.mwBars.style.opacity='1';
+    $.mwText.textContent='MUSIC';
   }
 }
 
 // Keyboard
 document.addEventListener('keydown',e=>{
   if(e.key==='Escape') closePopup();
-  if(e.key.toLowerCase()==='m' && document.getElementById('site').classList.contains('show')) toggleMusic();
+  if(e.key.toLowerCase()==='m' && $.site.classList.contains('show')) toggleMusic();
 });
 
-function sleep(ms){return new Promise(r=>setTimeout(r,ms));}
+// Hidden tab: stop the background video and music, resume them on return.
+// The rAF loops (cursor, typing, loader) already stop on their own while hidden.
+document.addEventListener('visibilitychange',()=>{
+  const v=$.bgVideo,a=$.bgAudio;
+  if(document.hidden){
+    if(v)v.pause();
+    if(isMusicOn)a.pause();
+  } else {
+    if(v)v.play().catch(()=>{});
+    if(isMusicOn)a.play().catch(()=>{});
+  }
+});
+
+// intro pauses are tracked so skipIntro can settle them; once skipped they resolve immediately
+const sleeps=new Map();
+function sleep(ms){
+  if(introSkipped) return Promise.resolve();
+  return new Promise(r=>{
+    const t=setTimeout(()=>{sleeps.delete(t);r();},ms);
+    sleeps.set(t,r);
+  });
+}
 </script>
 </body>
 </html>
 """
 
+def minify_css(css):
+    # comments and layout whitespace only; spaces inside values (calc, shorthands) stay
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r' ?([{};,>]) ?', r'\1', css)
+    return css.replace(';}', '}').strip()
+
+MAIN = MAIN.replace('<body>', '<body>\n' + ICON_SPRITE, 1)
+MAIN = re.sub(r'(?s)<style>(.*?)</style>', lambda m: '<style>' + minify_css(m.group(1)) + '</style>', MAIN)
+# Parse/compile once; render_template_string would redo this on every hit
+MAIN_TPL = app.jinja_env.from_string(MAIN)
+
+# The admin pages link their CSS from a content-hashed URL instead of inlining it,
+# so the browser fetches each sheet once and every later dashboard render is markup only
+ADMIN_CSS = {}
+
+def external_css(html, name):
+    css = minify_css(re.search(r'(?s)<style>(.*?)</style>', html).group(1)).encode()
+    fname = f'{name}.{hashlib.sha1(css).hexdigest()[:12]}.css'
+    ADMIN_CSS[fname] = (css, gzip.compress(css, 9))
+    return re.sub(r'(?s)<style>.*?</style>', lambda m: f'<link rel="stylesheet" href="/admin/css/{fname}">', html, count=1)
+
 # ══════════════════════════════════════════════
 #  ADMIN LOGIN
 # ══════════════════════════════════════════════
@@ -1341,10 +1515,13 @@ ADMIN_LOGIN = """<!DOCTYPE html>
 <head>
 <meta charset="UTF-8"><meta name="viewport" content="width=device-width,initial-scale=1.0">
 <title>Admin Login 🌸</title>
-<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:ital,wght@1,700&family=Dancing+Script:wght@600&family=Poppins:wght@300;400;500&display=swap" rel="stylesheet">
-<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.0/css/all.min.css">
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Playfair+Display:ital,wght@1,700&family=Dancing+Script:wght@600&family=Poppins:wght@400;600&display=swap" media="print" onload="this.media='all'">
+<noscript><link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Playfair+Display:ital,wght@1,700&family=Dancing+Script:wght@600&family=Poppins:wght@400;600&display=swap"></noscript>
 <style>
 *{margin:0;padding:0;box-sizing:border-box;}
+.ic{width:1em;height:1em;fill:currentColor;vertical-align:-.125em;}
 body{
   min-height:100vh;
   background:radial-gradient(ellipse at 20% 30%,rgba(185,79,204,.3),transparent 50%),
@@ -1376,7 +1553,7 @@ h1{
   color:rgba(255,150,190,.5);margin-bottom:35px;
 }
 .inp-wrap{position:relative;margin-bottom:20px;}
-.inp-wrap i{
+.inp-wrap .ic{
   position:absolute;left:16px;top:50%;transform:translateY(-50%);
   color:rgba(255,130,180,.5);font-size:.85rem;
 }
@@ -1419,10 +1596,10 @@ input::placeholder{color:rgba(255,150,190,.3);}
   <span class="card-icon">🌸</span>
   <h1>Admin Access</h1>
   <div class="sub">~ her secret garden ~</div>
-  {% if error %}<div class="err"><i class="fas fa-times-circle"></i> {{ error }}</div>{% endif %}
+  {% if error %}<div class="err"><svg class="ic"><use href="#i-times-circle"/></svg> {{ error }}</div>{% endif %}
   <form method="POST" action="/admin/login">
     <div class="inp-wrap">
-      <i class="fas fa-lock"></i>
+      <svg class="ic"><use href="#i-lock"/></svg>
       <input type="password" name="password" placeholder="Enter the secret password..." autofocus required>
     </div>
     <button type="submit" class="btn">✨ Enter Admin Panel</button>
@@ -1432,6 +1609,12 @@ input::placeholder{color:rgba(255,150,190,.3);}
 </body>
 </html>"""
 
+# The login page only ever renders with one of two fixed errors — build both once
+ADMIN_LOGIN = with_icons(external_css(ADMIN_LOGIN, 'login'))
+_login_tpl = app.jinja_env.from_string(ADMIN_LOGIN)
+LOGIN_PAGE = _login_tpl.render(error=None)
+LOGIN_FAIL_PAGE = _login_tpl.render(error='Wrong password, darling 💔')
+
 # ══════════════════════════════════════════════
 #  ADMIN DASHBOARD
 # ══════════════════════════════════════════════
@@ -1440,11 +1623,14 @@ ADMIN_DASH = """<!DOCTYPE html>
 <head>
 <meta charset="UTF-8"><meta name="viewport" content="width=device-width,initial-scale=1.0">
 <title>Admin Dashboard 🌸</title>
-<link href="https://fonts.googleapis.com/css2?family=Playfair+Display:ital,wght@1,700&family=Dancing+Script:wght@600&family=Poppins:wght@300;400;500;600&family=Montserrat:wght@300;400;600&display=swap" rel="stylesheet">
-<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.0/css/all.min.css">
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Playfair+Display:ital,wght@1,700&family=Dancing+Script:wght@600&family=Poppins:wght@400;600&family=Montserrat:wght@600&display=swap" media="print" onload="this.media='all'">
+<noscript><link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Playfair+Display:ital,wght@1,700&family=Dancing+Script:wght@600&family=Poppins:wght@400;600&family=Montserrat:wght@600&display=swap"></noscript>
 <style>
 :root{--pk:#ff4d8d;--pp:#b94fcc;--rd:#e8305a;--dark:#0d0015;--glass:rgba(255,255,255,.05);--border:rgba(255,130,180,.2);}
 *{margin:0;padding:0;box-sizing:border-box;}
+.ic{width:1em;height:1em;fill:currentColor;vertical-align:-.125em;}
 body{
   min-height:100vh;background:var(--dark);color:#fff;
   font-family:'Poppins',sans-serif;
@@ -1577,14 +1763,14 @@ body{
 <div class="top">
   <div class="top-brand">🌸 Admin Panel</div>
   <div class="top-btns">
-    <a href="/" target="_blank" class="tbtn tbtn-view"><i class="fas fa-eye"></i> View Site</a>
-    <a href="/admin/logout" class="tbtn tbtn-out"><i class="fas fa-sign-out-alt"></i> Logout</a>
+    <a href="/" target="_blank" class="tbtn tbtn-view"><svg class="ic"><use href="#i-eye"/></svg> View Site</a>
+    <a href="/admin/logout" class="tbtn tbtn-out"><svg class="ic"><use href="#i-sign-out"/></svg> Logout</a>
   </div>
 </div>
 
 {% if msg %}
 <div class="alert {{ 'alert-ok' if ok else 'alert-err' }}">
-  <i class="fas fa-{{ 'check-circle' if ok else 'exclamation-circle' }}"></i> {{ msg }}
+  {% if ok %}<svg class="ic"><use href="#i-check-circle"/></svg>{% else %}<svg class="ic"><use href="#i-exclamation-circle"/></svg>{% endif %} {{ msg }}
 </div>
 {% endif %}
 
@@ -1597,11 +1783,11 @@ body{
       <div class="stat-l">Name</div>
     </div>
     <div class="stat">
-      <div class="stat-v">{{ db.media_map.values()|list|select|list|length }}</div>
+      <div class="stat-v">{{ media_count }}</div>
       <div class="stat-l">Media Mapped</div>
     </div>
     <div class="stat">
-      <div class="stat-v">{{ db.socials.values()|list|select|list|length }}</div>
+      <div class="stat-v">{{ social_count }}</div>
       <div class="stat-l">Socials</div>
     </div>
     <div class="stat">
@@ -1614,7 +1800,7 @@ body{
 
     <!-- Profile -->
     <div class="sec">
-      <div class="sec-hd"><i class="fas fa-user sec-hd-icon"></i><div class="sec-hd-title">Profile Info</div></div>
+      <div class="sec-hd"><svg class="ic sec-hd-icon"><use href="#i-user"/></svg><div class="sec-hd-title">Profile Info</div></div>
       <div class="fgrid">
         <div class="fg"><div class="fl">Main Name</div><input class="fi" type="text" name="name" value="{{ db.profile.name }}" required></div>
         <div class="fg"><div class="fl">Subtitle (& QNR)</div><input class="fi" type="text" name="subtitle" value="{{ db.profile.subtitle }}"></div>
@@ -1626,35 +1812,27 @@ body{
 
     <!-- Bio Cards -->
     <div class="sec">
-      <div class="sec-hd"><i class="fas fa-id-card sec-hd-icon"></i><div class="sec-hd-title">Bio Card Values</div></div>
+      <div class="sec-hd"><svg class="ic sec-hd-icon"><use href="#i-id-card"/></svg><div class="sec-hd-title">Bio Card Values</div></div>
       <div class="fgrid">
-        <div class="fg"><div class="fl">✨ Age</div><input class="fi" type="text" name="age" value="{{ db.profile.age }}"></div>
-        <div class="fg"><div class="fl">🎂 Birthday</div><input class="fi" type="text" name="birthday" value="{{ db.profile.birthday }}"></div>
-        <div class="fg"><div class="fl">🌍 Location</div><input class="fi" type="text" name="location" value="{{ db.profile.location }}"></div>
-        <div class="fg"><div class="fl">🌙 Zodiac</div><input class="fi" type="text" name="zodiac" value="{{ db.profile.zodiac }}"></div>
-        <div class="fg"><div class="fl">🎨 Hobbies</div><input class="fi" type="text" name="hobbies" value="{{ db.profile.hobbies }}"></div>
-        <div class="fg"><div class="fl">🎵 Music</div><input class="fi" type="text" name="music" value="{{ db.profile.music }}"></div>
-        <div class="fg"><div class="fl">🌸 Vibe</div><input class="fi" type="text" name="vibe" value="{{ db.profile.vibe }}"></div>
-        <div class="fg"><div class="fl">💗 Bestie</div><input class="fi" type="text" name="bestie" value="{{ db.profile.bestie }}"></div>
-        <div class="fg full"><div class="fl">🦋 Quote</div><input class="fi" type="text" name="quote" value="{{ db.profile.quote }}"></div>
+        {% for key, _, _, icon, label in card_fields %}
+        <div class="fg{{ ' full' if loop.last }}"><div class="fl">{{ icon }} {{ label }}</div><input class="fi" type="text" name="{{ key }}" value="{{ db.profile[key] }}"></div>
+        {% endfor %}
       </div>
     </div>
 
     <!-- Socials -->
     <div class="sec">
-      <div class="sec-hd"><i class="fas fa-share-alt sec-hd-icon"></i><div class="sec-hd-title">Social Links</div></div>
+      <div class="sec-hd"><svg class="ic sec-hd-icon"><use href="#i-share-alt"/></svg><div class="sec-hd-title">Social Links</div></div>
       <div class="fgrid">
-        <div class="fg"><div class="fl"><i class="fab fa-instagram"></i> Instagram</div><input class="fi" type="url" name="instagram" value="{{ db.socials.instagram }}" placeholder="https://..."></div>
-        <div class="fg"><div class="fl"><i class="fab fa-twitter"></i> Twitter</div><input class="fi" type="url" name="twitter" value="{{ db.socials.twitter }}" placeholder="https://..."></div>
-        <div class="fg"><div class="fl"><i class="fab fa-tiktok"></i> TikTok</div><input class="fi" type="url" name="tiktok" value="{{ db.socials.tiktok }}" placeholder="https://..."></div>
-        <div class="fg"><div class="fl"><i class="fab fa-youtube"></i> YouTube</div><input class="fi" type="url" name="youtube" value="{{ db.socials.youtube }}" placeholder="https://..."></div>
-        <div class="fg"><div class="fl"><i class="fab fa-snapchat"></i> Snapchat</div><input class="fi" type="url" name="snapchat" value="{{ db.socials.snapchat }}" placeholder="https://..."></div>
+        {% for key, label in social_fields %}
+        <div class="fg"><div class="fl"><svg class="ic"><use href="#i-{{ key }}"/></svg> {{ label }}</div><input class="fi" type="url" name="{{ key }}" value="{{ db.socials[key] }}" placeholder="https://..."></div>
+        {% endfor %}
       </div>
     </div>
 
     <!-- Media -->
     <div class="sec">
-      <div class="sec-hd"><i class="fas fa-film sec-hd-icon"></i><div class="sec-hd-title">Background Video & Music</div></div>
+      <div class="sec-hd"><svg class="ic sec-hd-icon"><use href="#i-film"/></svg><div class="sec-hd-title">Background Video & Music</div></div>
       <div class="fgrid">
         <div class="fg full"><div class="fl">🎬 Background Video URL (MP4 / direct link — plays behind everything)</div><input class="fi" type="url" name="background_video" value="{{ db.background_video }}" placeholder="https://...mp4"></div>
         <div class="fg full"><div class="fl">🎵 Background Music URL (MP3)</div><input class="fi" type="url" name="background_music" value="{{ db.background_music }}" placeholder="https://...mp3"></div>
@@ -1663,7 +1841,7 @@ body{
 
     <!-- Intro Lines -->
     <div class="sec">
-      <div class="sec-hd"><i class="fas fa-feather sec-hd-icon"></i><div class="sec-hd-title">Intro Typing Lines</div></div>
+      <div class="sec-hd"><svg class="ic sec-hd-icon"><use href="#i-pencil"/></svg><div class="sec-hd-title">Intro Typing Lines</div></div>
       <div class="fg">
         <div class="fl">One line per row (shown during intro screen)</div>
         <textarea class="fta" name="intro_lines" style="min-height:150px;font-size:.8rem;">{{ db.intro_lines | join('\n') }}</textarea>
@@ -1672,29 +1850,23 @@ body{
 
     <!-- Card Media -->
     <div class="sec">
-      <div class="sec-hd"><i class="fas fa-play-circle sec-hd-icon"></i><div class="sec-hd-title">Card Media URLs</div></div>
+      <div class="sec-hd"><svg class="ic sec-hd-icon"><use href="#i-play-circle"/></svg><div class="sec-hd-title">Card Media URLs</div></div>
       <p style="font-size:.75rem;color:rgba(255,150,190,.4);margin-bottom:16px;font-family:'Poppins',sans-serif;">Assign MP3 / MP4 / YouTube URL to each card. Plays when tapped. 💕</p>
       <div class="mgrid">
-        <div class="mc"><div class="mc-hd"><div class="mc-icon">✨</div><div class="mc-title">Age Card</div></div><input class="fi" type="url" name="media_age" value="{{ db.media_map.age }}" placeholder="https://..."><div class="mc-hint">MP3 · MP4 · YouTube</div></div>
-        <div class="mc"><div class="mc-hd"><div class="mc-icon">🎂</div><div class="mc-title">Birthday Card</div></div><input class="fi" type="url" name="media_birthday" value="{{ db.media_map.birthday }}" placeholder="https://..."><div class="mc-hint">MP3 · MP4 · YouTube</div></div>
-        <div class="mc"><div class="mc-hd"><div class="mc-icon">🌍</div><div class="mc-title">Location Card</div></div><input class="fi" type="url" name="media_location" value="{{ db.media_map.location }}" placeholder="https://..."><div class="mc-hint">MP3 · MP4 · YouTube</div></div>
-        <div class="mc"><div class="mc-hd"><div class="mc-icon">🌙</div><div class="mc-title">Zodiac Card</div></div><input class="fi" type="url" name="media_zodiac" value="{{ db.media_map.zodiac }}" placeholder="https://..."><div class="mc-hint">MP3 · MP4 · YouTube</div></div>
-        <div class="mc"><div class="mc-hd"><div class="mc-icon">🎨</div><div class="mc-title">Hobbies Card</div></div><input class="fi" type="url" name="media_hobbies" value="{{ db.media_map.hobbies }}" placeholder="https://..."><div class="mc-hint">MP3 · MP4 · YouTube</div></div>
-        <div class="mc"><div class="mc-hd"><div class="mc-icon">🎵</div><div class="mc-title">Music Card</div></div><input class="fi" type="url" name="media_music" value="{{ db.media_map.music }}" placeholder="https://..."><div class="mc-hint">MP3 · MP4 · YouTube</div></div>
-        <div class="mc"><div class="mc-hd"><div class="mc-icon">🌸</div><div class="mc-title">Vibe Card</div></div><input class="fi" type="url" name="media_vibe" value="{{ db.media_map.vibe }}" placeholder="https://..."><div class="mc-hint">MP3 · MP4 · YouTube</div></div>
-        <div class="mc"><div class="mc-hd"><div class="mc-icon">💗</div><div class="mc-title">Bestie Card</div></div><input class="fi" type="url" name="media_bestie" value="{{ db.media_map.bestie }}" placeholder="https://..."><div class="mc-hint">MP3 · MP4 · YouTube</div></div>
-        <div class="mc"><div class="mc-hd"><div class="mc-icon">🦋</div><div class="mc-title">Quote Card</div></div><input class="fi" type="url" name="media_quote" value="{{ db.media_map.quote }}" placeholder="https://..."><div class="mc-hint">MP3 · MP4 · YouTube</div></div>
+        {% for key, _, _, icon, label in card_fields %}
+        <div class="mc"><div class="mc-hd"><div class="mc-icon">{{ icon }}</div><div class="mc-title">{{ label }} Card</div></div><input class="fi" type="url" name="media_{{ key }}" value="{{ db.media_map[key] }}" placeholder="https://..."><div class="mc-hint">MP3 · MP4 · YouTube</div></div>
+        {% endfor %}
       </div>
     </div>
 
     <div class="fsub">
-      <button type="submit" class="btn-save"><i class="fas fa-save"></i> Save All Changes</button>
+      <button type="submit" class="btn-save"><svg class="ic"><use href="#i-save"/></svg> Save All Changes</button>
     </div>
   </form>
 
   <!-- Password -->
   <div class="sec" style="margin-top:24px;">
-    <div class="sec-hd"><i class="fas fa-lock sec-hd-icon"></i><div class="sec-hd-title">Change Password</div></div>
+    <div class="sec-hd"><svg class="ic sec-hd-icon"><use href="#i-lock"/></svg><div class="sec-hd-title">Change Password</div></div>
     <div class="pw-box">
       <form method="POST" action="/admin/change-password">
         <div class="fgrid">
@@ -1703,7 +1875,7 @@ body{
           <div class="fg"><div class="fl">Confirm New</div><input class="fi" type="password" name="confirm_password" placeholder="Confirm..." required></div>
         </div>
         <div class="fsub" style="margin-top:16px;">
-          <button type="submit" class="btn-pw"><i class="fas fa-key"></i> Update Password</button>
+          <button type="submit" class="btn-pw"><svg class="ic"><use href="#i-key"/></svg> Update Password</button>
         </div>
       </form>
     </div>
@@ -1713,37 +1885,163 @@ body{
 </body>
 </html>"""
 
+# The dashboard's bio-value and card-media inputs loop over BIO_CARDS (defined with the
+# home page routes), so a card is added in one place; (key, label) for its social inputs
+ADMIN_SOCIAL_FIELDS = (
+    ('instagram', 'Instagram'),
+    ('twitter', 'Twitter'),
+    ('tiktok', 'TikTok'),
+    ('youtube', 'YouTube'),
+    ('snapchat', 'Snapchat'),
+)
+
+# the social icons are referenced through the loop variable, so name them up front
+ADMIN_DASH = with_icons(external_css(ADMIN_DASH, 'dash'), [k for k, _ in ADMIN_SOCIAL_FIELDS])
+ADMIN_TPL = app.jinja_env.from_string(ADMIN_DASH)
+
+def admin_page(db, msg=None, ok=False):
+    # the stat cards' counts in plain Python rather than a select|list|length chain per render
+    return ADMIN_TPL.render(db=db, msg=msg, ok=ok,
+                            card_fields=BIO_CARDS, social_fields=ADMIN_SOCIAL_FIELDS,
+                            media_count=sum(1 for v in db['media_map'].values() if v),
+                            social_count=sum(1 for v in db['socials'].values() if v))
+
 # ══════════════════════════════════════════════
 #  ROUTES
 # ══════════════════════════════════════════════
+# Jinja tries getattr before getitem, so slotted records beat dicts for p.name etc.
+# (the card loop uses p|attr(cat), since p[cat] would try getitem first and fail)
+@dataclass(slots=True, frozen=True)
+class Profile:
+    name: str = ''
+    subtitle: str = ''
+    tagline: str = ''
+    bio: str = ''
+    age: str = ''
+    birthday: str = ''
+    location: str = ''
+    zodiac: str = ''
+    hobbies: str = ''
+    music: str = ''
+    vibe: str = ''
+    bestie: str = ''
+    quote: str = ''
+    avatar: str = ''
+    avatar2: str = ''
+
+@dataclass(slots=True, frozen=True)
+class Socials:
+    instagram: str = ''
+    twitter: str = ''
+    tiktok: str = ''
+    youtube: str = ''
+    snapchat: str = ''
+
+def as_record(cls, section):
+    # stored sections may carry keys the schema doesn't know about; drop them
+    return cls(**{k: section[k] for k in cls.__slots__ if k in section})
+
+def encoded_response(raw, gz, mimetype):
+    # both bodies are built once per DB version; pick the gzipped one when the client takes it
+    use_gz = request.accept_encodings['gzip'] > 0  # parsed, so gzip;q=0 counts as a refusal
+    resp = Response(gz if use_gz else raw, mimetype=mimetype)
+    if use_gz: resp.headers['Content-Encoding'] = 'gzip'
+    resp.headers['Vary'] = 'Accept-Encoding'
+    return resp
+
+YT_ID_RE = re.compile(r'(?:v=|/embed/|youtu\.be/)([a-zA-Z0-9_-]{11})')
+VIDEO_RE = re.compile(r'\.(mp4|webm|mov)(\?|$)', re.I)
+
+def classify_media(url):
+    # once per render, so a card click is a property lookup rather than regexes in the browser
+    if not url: return None
+    if 'youtube.com' in url or 'youtu.be' in url:
+        m = YT_ID_RE.search(url)
+        return {'u': url, 'k': 'youtube', 'id': m.group(1) if m else ''}
+    return {'u': url, 'k': 'video' if VIDEO_RE.search(url) else 'audio'}
+
+# (profile key, icon, label, admin icon, admin label) — one bio card each, in page
+# order; the dashboard's inputs keep their own shorter captions
+BIO_CARDS = (
+    ('age', '✨', 'Age', '✨', 'Age'),
+    ('birthday', '🎂', 'Birthday', '🎂', 'Birthday'),
+    ('location', '🌍', 'Location', '🌍', 'Location'),
+    ('zodiac', '🌙', 'Zodiac', '🌙', 'Zodiac'),
+    ('hobbies', '🎨', 'Hobbies', '🎨', 'Hobbies'),
+    ('music', '🎵', 'Music', '🎵', 'Music'),
+    ('vibe', '🌙', 'My Vibe', '🌸', 'Vibe'),
+    ('bestie', '💗', 'Bestie', '💗', 'Bestie'),
+    ('quote', '🦋', 'Her Quote', '🦋', 'Quote'),
+)
+
+# Floating background particles: a fixed set laid out once, then looped by CSS alone.
+# Negative delays start each one mid-flight, so the sky is already full on load.
+PARTICLE_EMOJIS = ('🌸','💕','✨','🌹','💗','⭐','🦋','💜','🌙','💖','🌺','✿','♡','💫','🎀')
+
+def make_particles(n=24, seed=2024):
+    rnd = random.Random(seed)
+    out = []
+    for _ in range(n):
+        dur = 8 + rnd.random() * 15
+        out.append((rnd.choice(PARTICLE_EMOJIS), round(rnd.random() * 100, 1),
+                    round(.5 + rnd.random() * 1.2, 2), round(dur, 1), round(-rnd.random() * dur, 1)))
+    return tuple(out)
+
+PARTICLES = make_particles()
+
+# (db, raw, gz) for the home page, keyed on the cached DB object — load_db() swaps
+# that object on every save or cross-worker reload, so it doubles as the version
+index_cache = (None, None, None)
+
 @app.route('/')
 def index():
+    global index_cache
     db = load_db()
-    return render_template_string(MAIN,
-        p=db['profile'],
-        socials=db['socials'],
-        bg_video=db.get('background_video',''),
-        bg_music=db.get('background_music',''),
-        media_map=db['media_map'],
-        intro_lines=db['intro_lines']
-    )
+    cached_db, raw, gz = index_cache
+    if cached_db is not db:
+        media = {k: classify_media(v) for k, v in db['media_map'].items()}
+        html = MAIN_TPL.render(
+            p=as_record(Profile, db['profile']),
+            socials=as_record(Socials, db['socials']),
+            cards=BIO_CARDS,
+            particles=PARTICLES,
+            fonts_css=MAIN_FONTS_CSS,
+            bg_video=db.get('background_video',''),
+            bg_music=db.get('background_music',''),
+            media=media,
+            has_youtube=any(m and m['k'] == 'youtube' for m in media.values()),
+            intro_lines=db['intro_lines']
+        )
+        raw = html.encode()
+        gz = gzip.compress(raw, 9)
+        index_cache = (db, raw, gz)
+    resp = encoded_response(raw, gz, 'text/html')
+    resp.headers['Link'] = MAIN_LINK_HEADER
+    return resp
+
+@app.route('/admin/css/<name>')
+def admin_css(name):
+    # the hash in the name changes whenever the CSS does, so the body never goes stale
+    if name not in ADMIN_CSS: return 'Not found', 404
+    resp = encoded_response(*ADMIN_CSS[name], 'text/css')
+    resp.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return resp
 
 @app.route('/admin')
 @login_required
 def admin():
-    return render_template_string(ADMIN_DASH, db=load_db(), msg=None, ok=False)
+    return admin_page(load_db())
 
 @app.route('/admin/login', methods=['GET','POST'])
 def admin_login():
     if session.get('admin'): return redirect('/admin')
     if request.method=='POST':
         pw = request.form.get('password','')
-        db = load_db()
-        if hashlib.sha256(pw.encode()).hexdigest() == db['password']:
+        if verify_password(pw, load_db('password')):
             session['admin'] = True
             return redirect('/admin')
-        return render_template_string(ADMIN_LOGIN, error='Wrong password, darling 💔')
-    return render_template_string(ADMIN_LOGIN, error=None)
+        return LOGIN_FAIL_PAGE
+    return LOGIN_PAGE
 
 @app.route('/admin/logout')
 def admin_logout():
@@ -1752,73 +2050,40 @@ def admin_logout():
 @app.route('/admin/save', methods=['POST'])
 @login_required
 def admin_save():
-    db = load_db()
+    db = load_db_mutable()
     f = request.form
     try:
-        db['profile'].update({
-            'name': f.get('name','').strip(),
-            'subtitle': f.get('subtitle','').strip(),
-            'tagline': f.get('tagline','').strip(),
-            'bio': f.get('bio','').strip(),
-            'avatar': f.get('avatar','').strip(),
-            'age': f.get('age','').strip(),
-            'birthday': f.get('birthday','').strip(),
-            'location': f.get('location','').strip(),
-            'zodiac': f.get('zodiac','').strip(),
-            'hobbies': f.get('hobbies','').strip(),
-            'music': f.get('music','').strip(),
-            'vibe': f.get('vibe','').strip(),
-            'bestie': f.get('bestie','').strip(),
-            'quote': f.get('quote','').strip(),
-        })
-        db['socials'].update({
-            'instagram': f.get('instagram','').strip(),
-            'twitter': f.get('twitter','').strip(),
-            'tiktok': f.get('tiktok','').strip(),
-            'youtube': f.get('youtube','').strip(),
-            'snapchat': f.get('snapchat','').strip(),
-        })
+        profile_keys = ('name', 'subtitle', 'tagline', 'bio', 'avatar', *(k for k, *_ in BIO_CARDS))
+        db['profile'].update({k: f.get(k,'').strip() for k in profile_keys})
+        db['socials'].update({k: f.get(k,'').strip() for k, _ in ADMIN_SOCIAL_FIELDS})
         db['background_video'] = f.get('background_video','').strip()
         db['background_music'] = f.get('background_music','').strip()
         lines = [l.strip() for l in f.get('intro_lines','').split('\n') if l.strip()]
         if lines: db['intro_lines'] = lines
-        db['media_map'].update({
-            'age': f.get('media_age','').strip(),
-            'birthday': f.get('media_birthday','').strip(),
-            'location': f.get('media_location','').strip(),
-            'zodiac': f.get('media_zodiac','').strip(),
-            'hobbies': f.get('media_hobbies','').strip(),
-            'music': f.get('media_music','').strip(),
-            'vibe': f.get('media_vibe','').strip(),
-            'bestie': f.get('media_bestie','').strip(),
-            'quote': f.get('media_quote','').strip(),
-        })
+        db['media_map'].update({k: f.get('media_'+k,'').strip() for k, *_ in BIO_CARDS})
         save_db(db)
-        return render_template_string(ADMIN_DASH, db=db, msg='✓ Saved successfully! 💕', ok=True)
+        return admin_page(db, msg='✓ Saved successfully! 💕', ok=True)
     except Exception as e:
-        return render_template_string(ADMIN_DASH, db=db, msg=f'Error: {e}', ok=False)
+        return admin_page(db, msg=f'Error: {e}', ok=False)
 
 @app.route('/admin/change-password', methods=['POST'])
 @login_required
 def admin_change_pw():
-    db = load_db()
+    db = load_db_mutable()
     cur = request.form.get('current_password','')
     new = request.form.get('new_password','')
     con = request.form.get('confirm_password','')
-    if hashlib.sha256(cur.encode()).hexdigest() != db['password']:
-        return render_template_string(ADMIN_DASH, db=db, msg='Current password is wrong 💔', ok=False)
+    if not verify_password(cur, db['password']):
+        return admin_page(db, msg='Current password is wrong 💔', ok=False)
     if new != con:
-        return render_template_string(ADMIN_DASH, db=db, msg="Passwords don't match 💔", ok=False)
+        return admin_page(db, msg="Passwords don't match 💔", ok=False)
     if len(new) < 6:
-        return render_template_string(ADMIN_DASH, db=db, msg='Password too short (min 6) 💔', ok=False)
+        return admin_page(db, msg='Password too short (min 6) 💔', ok=False)
     db['password'] = hashlib.sha256(new.encode()).hexdigest()
     save_db(db)
-    return render_template_string(ADMIN_DASH, db=db, msg='Password updated! 🌸', ok=True)
+    return admin_page(db, msg='Password updated! 🌸', ok=True)
 
 if __name__ == '__main__':
-    if not os.path.exists(DB_FILE):
-        save_db(DEFAULT_DB)
-        print("✓ DB created | password: admin123")
     print("\n🌸 RUHI X QNR — GIRLY BIO WEBSITE")
     print("   Site  → http://localhost:5000/")
     print("   Admin → http://localhost:5000/admin")